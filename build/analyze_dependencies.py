@@ -6,6 +6,7 @@ Script d'analyse des dépendances pour optimiser la taille de l'exécutable
 import sys
 import os
 import importlib
+import importlib.util
 import pkgutil
 from pathlib import Path
 import subprocess
@@ -89,14 +90,14 @@ def analyze_package_dependencies():
     
     for package in packages:
         try:
-            # Tenter d'importer pour vérifier la présence
-            importlib.import_module(package)
+            # Vérifier la présence sans exécuter le module (find_spec n'importe rien)
+            if importlib.util.find_spec(package) is None:
+                package_sizes.append((package, 0, False))  # False = non installé
+                print(f"  ❌ {package:<15} : non installé")
+                continue
             size = get_package_size(package)
             package_sizes.append((package, size, True))  # True = installé
             print(f"  ✅ {package:<15} : {size:>8.1f} MB")
-        except ImportError:
-            package_sizes.append((package, 0, False))  # False = non installé
-            print(f"  ❌ {package:<15} : non installé")
         except Exception as e:
             print(f"  ⚠️  {package:<15} : erreur - {e}")
     
@@ -142,11 +143,10 @@ def identify_removable_packages():
     ]
     
     for package, reason in removable:
-        try:
-            importlib.import_module(package)
+        if importlib.util.find_spec(package) is not None:
             size = get_package_size(package)
             print(f"  🗑️  {package:<15} : {size:>8.1f} MB - {reason}")
-        except ImportError:
+        else:
             print(f"  ✅ {package:<15} : déjà absent")
 
 def analyze_torch_components():
@@ -154,8 +154,11 @@ def analyze_torch_components():
     print("\n🔥 Analyse des composants PyTorch...")
     
     try:
-        import torch
-        torch_path = Path(torch.__file__).parent
+        # Localiser PyTorch sans l'importer (pas d'initialisation CUDA)
+        torch_spec = importlib.util.find_spec('torch')
+        if torch_spec is None or not torch_spec.origin:
+            raise ImportError('torch')
+        torch_path = Path(torch_spec.origin).parent
         
         # Analyser les sous-dossiers de PyTorch
         subdirs = [d for d in torch_path.iterdir() if d.is_dir()]
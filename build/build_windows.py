@@ -5,21 +5,121 @@ Crée un exécutable standalone avec PyInstaller
 """
 
 import os
-import sys
+import re
 import shutil
+import fnmatch
+import sys
+import json
+import hashlib
+import stat
+import time
+import threading
 import subprocess
+import importlib.util
+import platform
+from importlib.metadata import distributions
+from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import argparse
 
+# Noms de modèles Demucs à embarquer, compilés une seule fois en alternance
+# (une recherche par fichier au lieu d'un test de sous-chaîne par nom)
+_DEMUCS_MODEL_NAMES = ('htdemucs', 'mdx', 'demucs')
+# Les checkpoints téléchargés par Demucs sont nommés <signature>-<checksum>.th
+_DEMUCS_MODEL_RE = re.compile('|'.join(map(re.escape, _DEMUCS_MODEL_NAMES)) + r'|^[0-9a-f]{8}-[0-9a-f]{8}\.th$')
+
+# Runtime VC redistribuable à embarquer (comparaison insensible à la casse, comme NTFS).
+# Jamais de DLL du système (kernel32, user32, ucrtbase, api-ms-win-*) copiées depuis
+# la machine de build
+_SYSTEM_DLLS = (
+    "vcruntime140.dll",
+    "msvcp140.dll",
+)
+_SYSTEM_DLL_NAMES = frozenset(_SYSTEM_DLLS)
+
+# DLL PyTorch/TorchAudio critiques : motifs glob fusionnés en une regex par bibliothèque
+_TORCH_DLL_RE = re.compile(
+    '|'.join(f'(?:{fnmatch.translate(p)})' for p in ("torch_cpu.dll", "torch_*.dll", "c10.dll", "fbgemm.dll")),
+    re.IGNORECASE,
+)
+_TORCHAUDIO_DLL_RE = re.compile(
+    '|'.join(f'(?:{fnmatch.translate(p)})' for p in ("torchaudio*.dll", "sox*.dll")),
+    re.IGNORECASE,
+)
+
+# Index persistant des modèles Demucs trouvés dans les caches torch
+_MODELS_INDEX_FILE = os.path.join(os.path.expanduser("~"), ".cache", "rocksmith_build", "models.json")
+
+# Extension de l'exécutable produit (Windows a toujours l'extension .exe)
+_EXE_EXTENSION = '.exe' if platform.system() == 'Windows' else ''
+
+# Arguments PyInstaller fixes du mode onefile (seules les DLL/données détectées varient)
+_ONEFILE_BASE_ARGS = (
+    '--clean',
+    '--noconfirm',
+    '--onefile',
+    '--windowed',  # Pas de console
+    '--name', 'RockSmithGuitarMute',
+
+    '--add-data', '../rs-utils;rs-utils',
+    '--add-data', '../rsrtools/src/rsrtools;rsrtools',
+    '--add-data', '../demucs/demucs;demucs',
+    '--add-data', '../demucs/conf;demucs/conf',
+    '--add-data', '../audio2wem_windows.py;.',
+)
+
+# Hidden imports essentiels du mode onefile avec focus sur la compatibilité CI
+_ONEFILE_HIDDEN_IMPORTS = (
+    'torch', 'torchaudio', 'demucs', 'demucs.separate', 'demucs.pretrained',
+    'soundfile', 'numpy', 'scipy', 'tkinter', 'tkinter.ttk',
+    'tkinter.filedialog', 'tkinter.messagebox',
+    'rsrtools.files.welder', 'rsrtools.files.config', 'rsrtools.files.exceptions',
+    'torch.nn', 'torch.nn.functional', 'torch.optim', 'torch.utils', 'torch.utils.data',
+    'torch._C', 'torch._C._nn', 'torch._C._fft', 'torch._C._linalg', 'torch._C._sparse',
+    'torch.backends', 'torch.backends.cpu', 'torch.backends.mkl', 'torch.backends.mkldnn',
+    'torchaudio.transforms', 'torchaudio.functional', 'torchaudio.models',
+    'torchaudio._extension', 'torchaudio.io',
+    'demucs.hdemucs', 'demucs.htdemucs', 'demucs.wdemucs', 'demucs.transformer',
+    'demucs.spec', 'demucs.states', 'demucs.utils', 'demucs.wav', 'demucs.audio',
+    'demucs.repo', 'demucs.apply',
+    # NumPy imports essentiels
+    'numpy.core', 'numpy.core.multiarray', 'numpy.core._multiarray_umath',
+    'numpy.core.multiarray_umath', 'numpy.core.numeric', 'numpy.core.umath',
+    'numpy._typing', 'numpy._typing._array_like', 'numpy._typing._dtype_like',
+    'numpy.lib', 'numpy.lib.recfunctions', 'numpy.ma', 'numpy.ma.core',
+    'numpy.random', 'numpy.random._pickle', 'numpy.linalg', 'numpy.fft',
+    'numpy.core._methods', 'numpy.core.arrayprint', 'numpy.core.fromnumeric',
+    'numpy.core.function_base', 'numpy.core.getlimits', 'numpy.core.shape_base',
+    # Dépendances Demucs pour CI
+    'diffq', 'einops', 'julius', 'openunmix', 'tqdm', 'omegaconf',
+    'hydra', 'hydra.core', 'hydra.core.config_store', 'hydra.core.global_hydra',
+    'dora', 'lameenc', 'packaging', 'setuptools', 'pkg_resources',
+    'dora_search',  # Nouvelle dépendance Demucs
+    # Imports supplémentaires pour éviter les erreurs CI
+    'typing_extensions', 'importlib_metadata', 'importlib_resources',
+    'antlr4', 'antlr4.tree', 'antlr4.error',  # Pour omegaconf
+)
+
+_ONEFILE_HIDDEN_IMPORT_ARGS = tuple(
+    arg for name in _ONEFILE_HIDDEN_IMPORTS for arg in ('--hidden-import', name)
+)
+
+
+def _normalize_dist_name(name):
+    """Normalise un nom de distribution pour la comparaison (PEP 503)."""
+    return re.sub(r'[-_.]+', '_', name).lower()
+
 
 def check_dependencies():
     """Vérifie que toutes les dépendances sont installées."""
-    print("Verification des dependances...")
+    lines = []  # Sortie regroupée en une seule écriture
+    lines.append("Verification des dependances...")
     
     # Afficher l'environnement pour debug
-    print(f"Environnement Python:")
-    print(f"  - Version: {sys.version}")
-    print(f"  - Executable: {sys.executable}")
+    lines.append(f"Environnement Python:")
+    lines.append(f"  - Version: {sys.version}")
+    lines.append(f"  - Executable: {sys.executable}")
     
     # Packages avec leurs noms d'import alternatifs
     required_packages = [
@@ -34,22 +134,27 @@ def check_dependencies():
     missing_packages = []
     version_info = {}
     
+    # Un seul parcours des distributions installées, sans exécuter le code des packages
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name:
+            installed.setdefault(_normalize_dist_name(name), dist.version)
+    
     for import_name, package_name in required_packages:
-        try:
-            module = __import__(import_name)
-            version = getattr(module, '__version__', 'version inconnue')
+        version = installed.get(_normalize_dist_name(package_name))
+        if version is None:
+            version = installed.get(_normalize_dist_name(import_name))
+        if version is None and importlib.util.find_spec(import_name) is not None:
+            # Module présent sur sys.path sans métadonnées (ex: source locale)
+            version = 'version inconnue'
+        
+        if version is not None:
             version_info[package_name] = version
-            print(f"  OK {package_name} ({version})")
-        except ImportError:
-            # Essayer avec le nom alternatif
-            try:
-                module = __import__(package_name)
-                version = getattr(module, '__version__', 'version inconnue')
-                version_info[package_name] = version
-                print(f"  OK {package_name} ({version})")
-            except ImportError:
-                missing_packages.append(package_name)
-                print(f"  ERREUR {package_name} (manquant)")
+            lines.append(f"  OK {package_name} ({version})")
+        else:
+            missing_packages.append(package_name)
+            lines.append(f"  ERREUR {package_name} (manquant)")
     
     # Vérifications spéciales pour PyTorch
     if 'torch' in version_info:
@@ -57,37 +162,71 @@ def check_dependencies():
             import torch
             cuda_available = torch.cuda.is_available()
             cuda_count = torch.cuda.device_count() if cuda_available else 0
-            print(f"  PyTorch CUDA: {'OK' if cuda_available else 'NON'} ({cuda_count} GPU(s))")
+            lines.append(f"  PyTorch CUDA: {'OK' if cuda_available else 'NON'} ({cuda_count} GPU(s))")
             
             # Détecter si on est dans un environnement CI
             is_ci = os.environ.get('GITHUB_ACTIONS') == 'true'
             if is_ci:
-                print(f"  Environnement CI detecte (GitHub Actions)")
+                lines.append(f"  Environnement CI detecte (GitHub Actions)")
             else:
-                print(f"  Environnement local detecte")
+                lines.append(f"  Environnement local detecte")
                 
         except Exception as e:
-            print(f"  ATTENTION Erreur lors de la verification PyTorch: {e}")
+            lines.append(f"  ATTENTION Erreur lors de la verification PyTorch: {e}")
     
     if missing_packages:
-        print(f"\nERREUR Packages manquants: {', '.join(missing_packages)}")
-        print("Installez-les avec: pip install " + " ".join(missing_packages))
+        lines.append(f"\nERREUR Packages manquants: {', '.join(missing_packages)}")
+        lines.append("Installez-les avec: pip install " + " ".join(missing_packages))
+        sys.stdout.write('\n'.join(lines) + '\n')
         return False
     
-    print("OK Toutes les dependances sont installees!")
+    lines.append("OK Toutes les dependances sont installees!")
+    sys.stdout.write('\n'.join(lines) + '\n')
     return True
 
 
+def _remove_with_retry(remove, path, attempts=3):
+    """Supprime un fichier/dossier en réessayant sur les erreurs transitoires Windows."""
+    for attempt in range(attempts):
+        try:
+            remove(path)
+            return
+        except PermissionError:
+            # Fichier en lecture seule ou verrouillé (antivirus, indexeur)
+            if attempt == attempts - 1:
+                raise
+            try:
+                os.chmod(path, stat.S_IWRITE)
+            except OSError:
+                pass
+            time.sleep(0.1)
+
+
+def _fast_rmtree(path):
+    """Supprime une arborescence en remontant depuis les feuilles."""
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            _remove_with_retry(os.unlink, os.path.join(root, name))
+        for name in dirs:
+            # Les liens symboliques vers des dossiers ne sont pas parcourus par os.walk
+            dir_path = os.path.join(root, name)
+            if os.path.islink(dir_path):
+                _remove_with_retry(os.unlink, dir_path)
+        _remove_with_retry(os.rmdir, root)
+    return path
+
+
 def clean_build_dirs():
     """Nettoie les répertoires de build précédents."""
     print("Nettoyage des builds precedents...")
     
-    dirs_to_clean = ['build', 'dist', '__pycache__']
+    dirs_to_clean = [d for d in ['build', 'dist', '__pycache__'] if Path(d).exists()]
     
-    for dir_name in dirs_to_clean:
-        if Path(dir_name).exists():
-            shutil.rmtree(dir_name)
-            print(f"  Supprime: {dir_name}")
+    # Supprimer les répertoires en parallèle (chaque suppression est un appel noyau lent sous Windows)
+    if dirs_to_clean:
+        with ThreadPoolExecutor(max_workers=len(dirs_to_clean)) as executor:
+            for dir_name in executor.map(_fast_rmtree, dirs_to_clean):
+                print(f"  Supprime: {dir_name}")
     
     # NE PAS supprimer les fichiers .spec - ils contiennent la configuration importante
     # for spec_file in Path('.').glob('*.spec'):
@@ -98,233 +237,476 @@ def clean_build_dirs():
 
 def get_torch_paths():
     """Récupère les chemins des bibliothèques PyTorch."""
-    try:
-        import torch
-        torch_path = Path(torch.__file__).parent
-        
-        # Chemins importants pour PyTorch
-        torch_lib = torch_path / "lib"
-        torch_bin = torch_path / "bin"
+    torch_dir = _package_dir('torch')
+    if torch_dir is None:
+        return []
+    torch_path = Path(torch_dir)
+    
+    # Chemins importants pour PyTorch
+    torch_lib = torch_path / "lib"
+    torch_bin = torch_path / "bin"
+    
+    paths = []
+    if torch_lib.exists():
+        paths.append(str(torch_lib))
+    if torch_bin.exists():
+        paths.append(str(torch_bin))
         
-        paths = []
-        if torch_lib.exists():
-            paths.append(str(torch_lib))
-        if torch_bin.exists():
-            paths.append(str(torch_bin))
-            
-        return paths
-    except ImportError:
+    return paths
+
+
+def _iter_files(root, suffix=None):
+    """Parcourt récursivement root avec os.scandir et produit les fichiers (os.DirEntry)."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, suffix)
+            elif (suffix is None or entry.name.endswith(suffix)) and entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def _is_system_dll(name):
+    """Indique si name est une des DLL système à embarquer."""
+    return name.lower() in _SYSTEM_DLL_NAMES
+
+
+def _package_dir(name):
+    """Dossier d'installation d'un paquet, trouvé sans exécuter son __init__ (None s'il est absent)."""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    if spec.origin:
+        return os.path.dirname(spec.origin)
+    # Paquet namespace : pas de fichier d'origine, prendre son premier dossier
+    locations = list(spec.submodule_search_locations or ())
+    return locations[0] if locations else None
+
+
+@lru_cache(maxsize=None)
+def _listdir(directory):
+    """Contenu d'un dossier lu en un seul os.scandir : {nom normalisé: DirEntry} ({} s'il est absent)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name): entry for entry in entries}
+    except OSError:
+        return {}
+
+
+def _lookup_file(path):
+    """Équivalent de os.path.isfile via l'instantané du dossier parent."""
+    entry = _listdir(os.path.dirname(path)).get(os.path.normcase(os.path.basename(path)))
+    return entry is not None and entry.is_file()
+
+
+def _lookup_dir(path):
+    """Équivalent de os.path.isdir via l'instantané du dossier parent."""
+    entry = _listdir(os.path.dirname(path)).get(os.path.normcase(os.path.basename(path)))
+    return entry is not None and entry.is_dir()
+
+
+def _probe_dir(directory, matches):
+    """Liste en un seul os.scandir les fichiers de directory dont le nom satisfait matches."""
+    if not os.path.isdir(directory):
         return []
+    with os.scandir(directory) as entries:
+        return [(entry.name, entry.path) for entry in entries
+                if matches(entry.name) and entry.is_file()]
 
 
+@lru_cache(maxsize=None)
 def get_python_dll_paths():
     """Récupère les chemins des DLL Python nécessaires."""
     import sys
     import os
     
     python_dll_paths = []
+    lines = []  # Sortie regroupée en une seule écriture
     
-    # Chemin de l'installation Python
-    python_dir = Path(sys.executable).parent
+    # Chemin de l'installation Python (chaînes os.path : pas d'objet Path par candidat)
+    python_dir = os.path.dirname(sys.executable)
+    python_parent = os.path.dirname(python_dir)
+    base_prefix = sys.base_prefix
     
     # Debug: afficher les chemins Python
-    print(f"DEBUG: Python executable: {sys.executable}")
-    print(f"DEBUG: Python directory: {python_dir}")
-    print(f"DEBUG: Python version: {sys.version}")
+    lines.append(f"DEBUG: Python executable: {sys.executable}")
+    lines.append(f"DEBUG: Python directory: {python_dir}")
+    lines.append(f"DEBUG: Python version: {sys.version}")
     
     # Vérifier si on est dans un environnement CI
     is_ci = os.environ.get('GITHUB_ACTIONS') == 'true'
     if is_ci:
-        print("DEBUG: Running in GitHub Actions CI environment")
+        lines.append("DEBUG: Running in GitHub Actions CI environment")
     
     # DLL Python principale - recherche exhaustive
     python_version = f"python{sys.version_info.major}{sys.version_info.minor}"
     
     # Emplacements possibles pour la DLL Python principale
     possible_locations = [
-        python_dir / f"{python_version}.dll",
-        python_dir.parent / "DLLs" / f"{python_version}.dll",
-        Path(sys.base_prefix) / f"{python_version}.dll",
-        Path(sys.base_prefix) / "DLLs" / f"{python_version}.dll",
-        Path(sys.executable).parent / f"{python_version}.dll",
+        os.path.join(python_dir, f"{python_version}.dll"),
+        os.path.join(python_parent, "DLLs", f"{python_version}.dll"),
+        os.path.join(base_prefix, f"{python_version}.dll"),
+        os.path.join(base_prefix, "DLLs", f"{python_version}.dll"),
         # Recherche dans System32 pour les installations système
-        Path(os.environ.get('SYSTEMROOT', 'C:\\Windows')) / "System32" / f"{python_version}.dll",
+        os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), "System32", f"{python_version}.dll"),
     ]
     
     python_dll_found = False
     for python_dll in possible_locations:
-        if python_dll.exists():
-            python_dll_paths.append((str(python_dll), '.'))
-            print(f"DEBUG: Found main Python DLL: {python_dll}")
+        if _lookup_file(python_dll):
+            python_dll_paths.append((python_dll, '.'))
+            lines.append(f"DEBUG: Found main Python DLL: {python_dll}")
             python_dll_found = True
             break
     
     if not python_dll_found:
-        print(f"WARNING: Main Python DLL {python_version}.dll not found in any location!")
-        # En dernier recours, chercher toute DLL python*.dll
-        for search_dir in [python_dir, python_dir.parent, Path(sys.base_prefix)]:
-            if search_dir.exists():
-                for dll_file in search_dir.rglob("python*.dll"):
-                    python_dll_paths.append((str(dll_file), '.'))
-                    print(f"DEBUG: Found fallback Python DLL: {dll_file}")
-                    python_dll_found = True
+        lines.append(f"WARNING: Main Python DLL {python_version}.dll not found in any location!")
+        search_dirs = [python_dir, python_parent, base_prefix]
+        
+        # La DLL exacte testée directement avant tout parcours récursif
+        # (jamais python3.dll ni pythonXY_d.dll : ce ne sont pas la DLL principale)
+        main_dll_name = f"{python_version}.dll"
+        fallback_candidates = [
+            os.path.join(search_dir, main_dll_name)
+            for search_dir in search_dirs + [os.path.join(base_prefix, "DLLs")]
+        ]
+        fallback_dll = next((c for c in fallback_candidates if _lookup_file(c)), None)
+        
+        # En dernier recours, chercher pythonXY.dll récursivement (arrêt au premier résultat)
+        if fallback_dll is None:
+            for search_dir in search_dirs:
+                if os.path.isdir(search_dir):
+                    fallback_dll = next((entry.path for entry in _iter_files(search_dir, ".dll")
+                                         if entry.name.lower() == main_dll_name), None)
+                if fallback_dll is not None:
                     break
-            if python_dll_found:
-                break
+        
+        if fallback_dll is not None:
+            python_dll_paths.append((fallback_dll, '.'))
+            lines.append(f"DEBUG: Found fallback Python DLL: {fallback_dll}")
+            python_dll_found = True
     
     # DLLs dans le dossier DLLs
-    dlls_dir = python_dir / "DLLs"
-    if dlls_dir.exists():
+    dlls_dir = os.path.join(python_dir, "DLLs")
+    if _lookup_dir(dlls_dir):
         dll_count = 0
-        for dll_file in dlls_dir.glob("*.dll"):
-            python_dll_paths.append((str(dll_file), 'DLLs'))
-            dll_count += 1
-        print(f"DEBUG: Found {dll_count} DLLs in {dlls_dir}")
+        for entry in _listdir(dlls_dir).values():
+            if entry.name.endswith('.dll'):
+                python_dll_paths.append((entry.path, 'DLLs'))
+                dll_count += 1
+        lines.append(f"DEBUG: Found {dll_count} DLLs in {dlls_dir}")
     else:
-        print(f"DEBUG: DLLs directory not found at: {dlls_dir}")
+        lines.append(f"DEBUG: DLLs directory not found at: {dlls_dir}")
         # Recherche alternative pour les DLL
         if is_ci:
             alt_dlls_dirs = [
-                python_dir.parent / "DLLs",
-                Path(sys.base_prefix) / "DLLs"
+                os.path.join(python_parent, "DLLs"),
+                os.path.join(base_prefix, "DLLs")
             ]
             for alt_dir in alt_dlls_dirs:
-                if alt_dir.exists():
+                if _lookup_dir(alt_dir):
                     dll_count = 0
-                    for dll_file in alt_dir.glob("*.dll"):
-                        python_dll_paths.append((str(dll_file), 'DLLs'))
-                        dll_count += 1
-                    print(f"DEBUG: Found {dll_count} DLLs in alternative location: {alt_dir}")
+                    for entry in _listdir(alt_dir).values():
+                        if entry.name.endswith('.dll'):
+                            python_dll_paths.append((entry.path, 'DLLs'))
+                            dll_count += 1
+                    lines.append(f"DEBUG: Found {dll_count} DLLs in alternative location: {alt_dir}")
                     break
     
-    # Bibliothèques système importantes
-    system_dlls = [
-        "vcruntime140.dll",
-        "msvcp140.dll", 
-        "api-ms-win-crt-runtime-l1-1-0.dll",
-        "ucrtbase.dll",
-        "kernel32.dll",
-        "user32.dll"
-    ]
-    
     # Chercher dans System32 et SysWOW64
+    system_root = os.environ.get('SYSTEMROOT', 'C:\\Windows')
     system_dirs = [
-        Path(os.environ.get('SYSTEMROOT', 'C:\\Windows')) / "System32",
-        Path(os.environ.get('SYSTEMROOT', 'C:\\Windows')) / "SysWOW64"
+        os.path.join(system_root, "System32"),
+        os.path.join(system_root, "SysWOW64")
     ]
     
+    # Dossiers PyTorch et TorchAudio contenant les DLL critiques
+    torch_lib_dirs = []
+    torchaudio_lib_dirs = []
+    # Localisés via find_spec, sans import : pas de chargement des DLL CUDA pour lire un chemin
+    torch_dir = _package_dir('torch')
+    torchaudio_dir = _package_dir('torchaudio')
+    torch_available = torch_dir is not None and torchaudio_dir is not None
+    if torch_available:
+        torch_lib_dirs = [os.path.join(torch_dir, "lib"), os.path.join(torch_dir, "bin"), torch_dir]
+        torchaudio_lib_dirs = [os.path.join(torchaudio_dir, "lib"), os.path.join(torchaudio_dir, "bin"), torchaudio_dir]
+    
+    # Sonder tous les dossiers en parallèle : un os.scandir par dossier, E/S indépendantes
+    probe_tasks = (
+        [(system_dir, _is_system_dll) for system_dir in system_dirs]
+        + [(lib_dir, _TORCH_DLL_RE.match) for lib_dir in torch_lib_dirs]
+        + [(lib_dir, _TORCHAUDIO_DLL_RE.match) for lib_dir in torchaudio_lib_dirs]
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        probe_results = list(executor.map(lambda task: _probe_dir(*task), probe_tasks))
+    system_results = probe_results[:len(system_dirs)]
+    torch_results = probe_results[len(system_dirs):len(system_dirs) + len(torch_lib_dirs)]
+    torchaudio_results = probe_results[len(system_dirs) + len(torch_lib_dirs):]
+    
     system_dll_count = 0
-    for system_dir in system_dirs:
-        if system_dir.exists():
-            for dll_name in system_dlls:
-                dll_path = system_dir / dll_name
-                if dll_path.exists():
-                    python_dll_paths.append((str(dll_path), '.'))
-                    system_dll_count += 1
-                    break  # Prendre seulement la première occurrence
-    print(f"DEBUG: Found {system_dll_count}/{len(system_dlls)} system DLLs")
+    remaining = set(_SYSTEM_DLL_NAMES)
+    for found in system_results:
+        for dll_name, dll_path in found:
+            if dll_name.lower() in remaining:
+                python_dll_paths.append((dll_path, '.'))
+                remaining.discard(dll_name.lower())  # Prendre seulement la première occurrence
+                system_dll_count += 1
+    lines.append(f"DEBUG: Found {system_dll_count}/{len(_SYSTEM_DLLS)} system DLLs")
     
     # Rechercher les DLL spécifiques à PyTorch et TorchAudio
-    try:
-        import torch
-        import torchaudio
-        
-        torch_dir = Path(torch.__file__).parent
-        torchaudio_dir = Path(torchaudio.__file__).parent
+    if torch_available:
+        torch_dlls = []
+        # Tout va dans '.' : une DLL présente dans lib/ et bin/ (ou déjà ajoutée) n'est gardée qu'une fois
+        seen_names = {os.path.basename(path).lower() for path, dest in python_dll_paths if dest == '.'}
         
         # DLL PyTorch critiques
-        torch_dlls = []
-        for torch_lib_dir in [torch_dir / "lib", torch_dir / "bin", torch_dir]:
-            if torch_lib_dir.exists():
-                for dll_pattern in ["torch_cpu.dll", "torch_*.dll", "c10.dll", "fbgemm.dll"]:
-                    for dll_file in torch_lib_dir.glob(dll_pattern):
-                        torch_dlls.append((str(dll_file), '.'))
-                        print(f"DEBUG: Found PyTorch DLL: {dll_file.name}")
+        for found in torch_results:
+            for dll_name, dll_path in found:
+                if dll_name.lower() in seen_names:
+                    continue
+                seen_names.add(dll_name.lower())
+                torch_dlls.append((dll_path, '.'))
+                lines.append(f"DEBUG: Found PyTorch DLL: {dll_name}")
         
-        # DLL TorchAudio critiques  
-        for torchaudio_lib_dir in [torchaudio_dir / "lib", torchaudio_dir / "bin", torchaudio_dir]:
-            if torchaudio_lib_dir.exists():
-                for dll_pattern in ["torchaudio*.dll", "sox*.dll"]:
-                    for dll_file in torchaudio_lib_dir.glob(dll_pattern):
-                        torch_dlls.append((str(dll_file), '.'))
-                        print(f"DEBUG: Found TorchAudio DLL: {dll_file.name}")
+        # DLL TorchAudio critiques
+        for found in torchaudio_results:
+            for dll_name, dll_path in found:
+                if dll_name.lower() in seen_names:
+                    continue
+                seen_names.add(dll_name.lower())
+                torch_dlls.append((dll_path, '.'))
+                lines.append(f"DEBUG: Found TorchAudio DLL: {dll_name}")
         
         python_dll_paths.extend(torch_dlls)
-        print(f"DEBUG: Found {len(torch_dlls)} PyTorch/TorchAudio DLLs")
-        
-    except ImportError:
-        print("DEBUG: PyTorch/TorchAudio not available for DLL detection")
+        lines.append(f"DEBUG: Found {len(torch_dlls)} PyTorch/TorchAudio DLLs")
+    else:
+        lines.append("DEBUG: PyTorch/TorchAudio not available for DLL detection")
     
     # Vérification finale
     total_dlls = len(python_dll_paths)
-    print(f"DEBUG: Total DLLs found: {total_dlls}")
+    lines.append(f"DEBUG: Total DLLs found: {total_dlls}")
     
     if total_dlls < 5:  # Minimum attendu
-        print("WARNING: Very few DLLs found - this may cause runtime errors!")
-        print("This could explain the 'Failed to load Python DLL' error.")
+        lines.append("WARNING: Very few DLLs found - this may cause runtime errors!")
+        lines.append("This could explain the 'Failed to load Python DLL' error.")
     
-    return python_dll_paths
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return tuple(python_dll_paths)
+
+
+def _find_demucs_models(model_locations):
+    """Liste les modèles Demucs (chemin, taille) des caches, via un index persistant."""
+    # Empreinte = filtre + mtime des dossiers de cache (change dès qu'un modèle est ajouté/supprimé)
+    fingerprint = _DEMUCS_MODEL_RE.pattern + '|' + '|'.join(
+        f"{d}:{os.stat(d).st_mtime_ns}" for d in model_locations if os.path.isdir(d))
+    key = hashlib.md5(fingerprint.encode('utf-8')).hexdigest()
+    
+    try:
+        with open(_MODELS_INDEX_FILE, encoding='utf-8') as f:
+            index = json.load(f)
+        if index['key'] == key and all(os.path.isfile(path) for path, _ in index['models']):
+            print(f"DEBUG: Demucs models read from index {_MODELS_INDEX_FILE}")
+            return [tuple(model) for model in index['models']]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    models = []
+    seen = set()
+    for cache_dir in model_locations:
+        if os.path.isdir(cache_dir):
+            print(f"DEBUG: Searching in {cache_dir}")
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    # Vérifier si c'est un modèle Demucs
+                    if not (entry.name.endswith(".th") and _DEMUCS_MODEL_RE.search(entry.name)):
+                        continue
+                    # Même fichier vu par deux caches (lien symbolique/physique) : ne l'inclure qu'une fois
+                    st = os.stat(entry.path)
+                    file_id = (st.st_dev, st.st_ino)
+                    if file_id in seen:
+                        continue
+                    seen.add(file_id)
+                    models.append((entry.path, st.st_size))
+    
+    try:
+        os.makedirs(os.path.dirname(_MODELS_INDEX_FILE), exist_ok=True)
+        tmp_file = _MODELS_INDEX_FILE + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'models': models}, f)
+        os.replace(tmp_file, _MODELS_INDEX_FILE)
+    except OSError as e:
+        print(f"WARNING: Could not write models index: {e}")
+    return models
 
 
+@lru_cache(maxsize=None)
 def get_demucs_data_files():
     """Récupère les fichiers de données Demucs nécessaires."""
     try:
         import demucs
-        import torch
-        demucs_path = Path(demucs.__file__).parent
+        demucs_path = os.path.dirname(demucs.__file__)
         
         data_files = []
         
+        # Destination = dossier parent relatif à site-packages, par simple découpe de chaîne
+        base_len = len(os.path.dirname(demucs_path)) + 1
+        
         # Fichiers de configuration
-        conf_dir = demucs_path / "conf"
-        if conf_dir.exists():
-            for conf_file in conf_dir.rglob("*.yaml"):
-                rel_path = conf_file.relative_to(demucs_path.parent)
-                data_files.append((str(conf_file), str(rel_path.parent)))
+        conf_dir = os.path.join(demucs_path, "conf")
+        if os.path.isdir(conf_dir):
+            for conf_entry in _iter_files(conf_dir, ".yaml"):
+                data_files.append((conf_entry.path, os.path.dirname(conf_entry.path)[base_len:]))
         
         # Fichiers remote
-        remote_dir = demucs_path / "remote"
-        if remote_dir.exists():
-            for remote_file in remote_dir.rglob("*"):
-                if remote_file.is_file():
-                    rel_path = remote_file.relative_to(demucs_path.parent)
-                    data_files.append((str(remote_file), str(rel_path.parent)))
-        
-        # Inclure les modèles Demucs téléchargés
-        print("DEBUG: Searching for Demucs models...")
-        model_locations = [
-            Path.home() / ".cache" / "torch" / "hub" / "checkpoints",
-            Path.home() / "AppData" / "Local" / "torch" / "hub" / "checkpoints",
-            Path.home() / ".torch" / "models",
-        ]
-        
-        model_count = 0
-        for cache_dir in model_locations:
-            if cache_dir.exists():
-                print(f"DEBUG: Searching in {cache_dir}")
-                for model_file in cache_dir.glob("*.th"):
-                    # Vérifier si c'est un modèle Demucs
-                    if any(model_name in model_file.name for model_name in ['htdemucs', 'mdx', 'demucs']):
-                        data_files.append((str(model_file), 'torch_models'))
-                        model_count += 1
-                        print(f"DEBUG: Including model: {model_file.name} ({model_file.stat().st_size / (1024*1024):.1f} MB)")
+        remote_dir = os.path.join(demucs_path, "remote")
+        if os.path.isdir(remote_dir):
+            for remote_entry in _iter_files(remote_dir):
+                data_files.append((remote_entry.path, os.path.dirname(remote_entry.path)[base_len:]))
         
-        print(f"DEBUG: Found {model_count} Demucs model files")
-        if model_count == 0:
-            print("WARNING: No Demucs models found! The application may not work properly.")
+        # Les modèles Demucs ne sont plus embarqués ici : ils sont livrés à côté de
+        # l'exécutable (voir copy_demucs_models) et lus sur place via TORCH_HOME
         
-        return data_files
+        return tuple(data_files)
     except ImportError:
-        return []
+        return ()
+
+
+
+@lru_cache(maxsize=None)
+def get_demucs_model_files():
+    """Récupère les modèles Demucs téléchargés (chemin, taille) à livrer avec l'exécutable."""
+    print("DEBUG: Searching for Demucs models...")
+    home = os.path.expanduser("~")
+    model_locations = [
+        os.path.join(home, ".cache", "torch", "hub", "checkpoints"),
+        os.path.join(home, "AppData", "Local", "torch", "hub", "checkpoints"),
+        os.path.join(home, ".torch", "models"),
+    ]
+    
+    models = tuple(_find_demucs_models(model_locations))
+    for model_path, model_size in models:
+        print(f"DEBUG: Including model: {os.path.basename(model_path)} ({model_size / (1024*1024):.1f} MB)")
+    
+    print(f"DEBUG: Found {len(models)} Demucs model files")
+    if not models:
+        print("WARNING: No Demucs models found! The application may not work properly.")
+    return models
+
+
+def copy_demucs_models(target_dir):
+    """Copie les modèles Demucs dans target_dir/models/hub/checkpoints (disposition attendue par torch.hub)."""
+    checkpoints_dir = os.path.join(target_dir, "models", "hub", "checkpoints")
+    os.makedirs(checkpoints_dir, exist_ok=True)
+    
+    copied = 0
+    for model_path, model_size in get_demucs_model_files():
+        dest = os.path.join(checkpoints_dir, os.path.basename(model_path))
+        # Déjà présent (build précédent non nettoyé) : inutile de recopier des centaines de Mo
+        if os.path.isfile(dest) and os.path.getsize(dest) == model_size:
+            continue
+        shutil.copy2(model_path, dest)
+        copied += 1
+    
+    print(f"OK {copied} modele(s) Demucs copie(s) dans {checkpoints_dir}")
+    return checkpoints_dir
+
+
+# Cache persistant des DLL découvertes, partagé entre les builds
+_DLL_INDEX_FILE = Path.home() / '.cache' / 'rocksmith_build' / 'dll_index.json'
+_DLL_INDEX_LOCK = threading.Lock()
+
+
+def _dll_index_key():
+    """Empreinte de l'installation Python/PyTorch utilisée comme clé du cache."""
+    parts = [sys.executable, str(os.stat(sys.executable).st_mtime_ns)]
+    # Une mise à jour de torch ou torchaudio change les DLL à embarquer
+    for package in ('torch', 'torchaudio'):
+        spec = importlib.util.find_spec(package)
+        if spec is not None and spec.origin:
+            parts += [spec.origin, str(os.stat(spec.origin).st_mtime_ns)]
+    # Les runtimes VC sont pris dans les dossiers système : un ajout/retrait y change la date
+    system_root = os.environ.get('SYSTEMROOT', 'C:\\Windows')
+    for system_dir in ("System32", "SysWOW64"):
+        try:
+            parts.append(str(os.stat(os.path.join(system_root, system_dir)).st_mtime_ns))
+        except OSError:
+            pass
+    return hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _load_dll_index():
+    """Charge le cache des DLL (vide s'il est absent ou illisible)."""
+    try:
+        with open(_DLL_INDEX_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_dll_index(index):
+    """Écrit le cache des DLL de façon atomique."""
+    _DLL_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = _DLL_INDEX_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(tmp_file, _DLL_INDEX_FILE)
+
+
+def _clear_caches():
+    """Vide les caches de découverte en mémoire."""
+    get_python_dll_paths.cache_clear()
+    _listdir.cache_clear()
+    get_demucs_data_files.cache_clear()
+    get_demucs_model_files.cache_clear()
+
+
+def invalidate_dll_index():
+    """Supprime les caches de découverte des DLL et modèles (forcé par --clean-only)."""
+    _clear_caches()
+    with _DLL_INDEX_LOCK:
+        for index_file in (_DLL_INDEX_FILE, Path(_MODELS_INDEX_FILE)):
+            if index_file.exists():
+                index_file.unlink()
+                print(f"  Supprime: {index_file}")
+
+
+def _cached_discovery(name, discover):
+    """Retourne le résultat de discover() depuis le cache persistant si l'installation n'a pas changé."""
+    key = _dll_index_key()
+    with _DLL_INDEX_LOCK:
+        entry = _load_dll_index().get(key, {})
+    if name in entry:
+        print(f"DEBUG: {name} lu depuis le cache {_DLL_INDEX_FILE}")
+        return tuple(tuple(item) if isinstance(item, list) else item for item in entry[name])
+    
+    # Même type que lors d'une lecture du cache, quel que soit celui de discover()
+    result = tuple(discover())
+    
+    with _DLL_INDEX_LOCK:
+        # Une seule empreinte conservée : l'ancienne installation ne sert plus
+        entry = _load_dll_index().get(key, {})
+        entry[name] = list(result)
+        try:
+            _save_dll_index({key: entry})
+        except OSError as e:
+            print(f"  ATTENTION Impossible d'ecrire le cache des DLL: {e}")
+    return result
 
 
 def create_pyinstaller_spec(onefile=False, debug=False):
     """Crée le fichier .spec pour PyInstaller."""
     print("Creation du fichier de configuration PyInstaller...")
     
-    torch_paths = get_torch_paths()
-    demucs_data = get_demucs_data_files()
-    python_dlls = get_python_dll_paths()
+    # Les trois découvertes sont indépendantes et dominées par les E/S disque
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        torch_future = executor.submit(_cached_discovery, 'torch_paths', get_torch_paths)
+        demucs_future = executor.submit(get_demucs_data_files)
+        dlls_future = executor.submit(_cached_discovery, 'python_dlls', get_python_dll_paths)
+        torch_paths = torch_future.result()
+        demucs_data = demucs_future.result()
+        python_dlls = dlls_future.result()
     
     print(f"DLL Python detectees: {len(python_dlls)}")
     for dll_path, dest in python_dlls[:5]:  # Afficher les 5 premières
@@ -334,21 +716,27 @@ def create_pyinstaller_spec(onefile=False, debug=False):
     
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
 
+import os
 import sys
+import json
 from pathlib import Path
 
 # Configuration de base
 block_cipher = None
 app_name = "RockSmithGuitarMute"
 
+# Chemins détectés par build_windows.py (fichier annexe généré à côté du .spec)
+with open(os.path.join(SPECPATH, 'build_data.json'), encoding='utf-8') as f:
+    build_data = json.load(f)
+
 # Chemins des bibliothèques
-torch_paths = {torch_paths}
+torch_paths = build_data['torch_paths']
 
 # DLL Python nécessaires
-python_dlls = {python_dlls}
+python_dlls = [tuple(item) for item in build_data['python_dlls']]
 
 # Données Demucs
-demucs_datas = {demucs_data}
+demucs_datas = [tuple(item) for item in build_data['demucs_datas']]
 
 # Données du projet
 project_datas = [
@@ -359,8 +747,8 @@ project_datas = [
     ('../audio2wem_windows.py', '.'),
 ]
 
-# Modules cachés nécessaires
-hidden_imports = [
+# Modules cachés nécessaires (dédoublonnés et triés au chargement du .spec)
+hidden_imports = sorted(frozenset([
     'torch',
     'torchaudio', 
     'demucs',
@@ -439,24 +827,26 @@ hidden_imports = [
     'numpy.random._pickle',
     'numpy.linalg',
     'numpy.fft',
-]
+]))
 
-            # Exclusions pour réduire la taille (mais garder les dépendances essentielles)
-        excludes = [
-            'matplotlib',
-            'IPython',
-            'jupyter',
-            'notebook',
-            'pandas',
-            'sklearn',
-            'cv2',
-            'PIL',
-            'pytest',
-            # Ne pas exclure setuptools car PyTorch en a besoin
-            # 'setuptools',
-            # Ne pas exclure numpy.core - critique pour le fix CI
-            # 'numpy.core',
-        ]a = Analysis(
+# Exclusions pour réduire la taille (mais garder les dépendances essentielles)
+excludes = sorted(frozenset([
+    'matplotlib',
+    'IPython',
+    'jupyter',
+    'notebook',
+    'pandas',
+    'sklearn',
+    'cv2',
+    'PIL',
+    'pytest',
+    # Ne pas exclure setuptools car PyTorch en a besoin
+    # 'setuptools',
+    # Ne pas exclure numpy.core - critique pour le fix CI
+    # 'numpy.core',
+]))
+
+a = Analysis(
     ['../gui/gui_main.py'],
     pathex=['..'],
     binaries=python_dlls,
@@ -505,14 +895,73 @@ coll = COLLECT(
 )
 '''
     
+    # Les listes volumineuses vont dans un JSON annexe plutôt qu'en littéral dans le .spec
+    build_data = {
+        'torch_paths': torch_paths,
+        'python_dlls': python_dlls,
+        'demucs_datas': demucs_data,
+    }
+    with open('build_data.json', 'w', encoding='utf-8') as f:
+        json.dump(build_data, f)
+    
     with open('rocksmith_gui.spec', 'w', encoding='utf-8') as f:
         f.write(spec_content)
     
     print("OK Fichier rocksmith_gui.spec cree!")
 
 
-def build_executable(debug=False, onefile=False):
-    """Compile l'exécutable avec PyInstaller."""
+def build_executable_nuitka(debug=False):
+    """Compile l'exécutable avec Nuitka (Python compilé en C, démarrage plus rapide).
+    
+    Nécessite un compilateur C (MSVC ou MinGW64, téléchargé automatiquement par Nuitka).
+    Sous Linux, l'exécutable produit dépend de la glibc de la machine de compilation.
+    """
+    print("Compilation de l'executable avec Nuitka...")
+    
+    cmd = [
+        sys.executable, '-m', 'nuitka',
+        '--onefile',
+        '--assume-yes-for-downloads',
+        f"--windows-console-mode={'force' if debug else 'disable'}",
+        '--enable-plugin=tk-inter',
+        '--output-dir=dist',
+        f'--output-filename=RockSmithGuitarMute{_EXE_EXTENSION}',
+        '--windows-icon-from-ico=../RSGM_v1a_box.ico',
+        # torch n'est pas forcé en entier (tests, _dynamo...) : le plugin torch de
+        # Nuitka et le graphe d'imports suffisent
+        '--include-package=demucs',
+        # Données lues par demucs.pretrained à l'exécution (remote/*.yaml, files.txt)
+        '--include-package-data=demucs',
+        '--include-package=rsrtools',
+        '--include-data-dir=../rs-utils=rs-utils',
+        '--include-data-files=../audio2wem_windows.py=audio2wem_windows.py',
+    ]
+    demucs_dir = _package_dir('demucs')
+    if demucs_dir is not None and os.path.isdir(os.path.join(demucs_dir, 'conf')):
+        cmd.append(f"--include-data-dir={os.path.join(demucs_dir, 'conf')}=demucs/conf")
+    cmd.append('../gui/gui_main.py')
+    
+    print(f"Commande: {' '.join(cmd)}")
+    
+    # Diffuser la sortie de Nuitka ligne par ligne
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, bufsize=1)
+    for line in proc.stdout:
+        sys.stdout.write(line)
+    returncode = proc.wait()
+    if returncode:
+        print(f"ERREUR Erreur de compilation Nuitka (code {returncode})")
+        return False
+    
+    print("OK Compilation reussie!")
+    return True
+
+
+def build_executable(debug=False, onefile=False, nuitka=False):
+    """Compile l'exécutable avec PyInstaller (ou Nuitka si demandé)."""
+    if nuitka:
+        return build_executable_nuitka(debug=debug)
+    
     print("Compilation de l'executable...")
     
     if onefile:
@@ -520,27 +969,14 @@ def build_executable(debug=False, onefile=False):
         print("DEBUG: Utilisation de la logique amelioree avec inclusion DLL")
         
         # Récupérer les DLL Python pour les inclure explicitement
-        python_dlls = get_python_dll_paths()
+        python_dlls = _cached_discovery('python_dlls', get_python_dll_paths)
         demucs_data = get_demucs_data_files()
         
         print(f"DEBUG: Trouvé {len(python_dlls)} DLL Python à inclure")
         print(f"DEBUG: Trouvé {len(demucs_data)} fichiers Demucs à inclure")
         
         # Pour onefile, utiliser directement PyInstaller sans .spec
-        cmd = [
-            sys.executable, '-m', 'PyInstaller',
-            '--clean',
-            '--noconfirm',
-            '--onefile',
-            '--windowed',  # Pas de console
-            '--name', 'RockSmithGuitarMute',
-
-            '--add-data', '../rs-utils;rs-utils',
-            '--add-data', '../rsrtools/src/rsrtools;rsrtools', 
-            '--add-data', '../demucs/demucs;demucs',
-            '--add-data', '../demucs/conf;demucs/conf',
-            '--add-data', '../audio2wem_windows.py;.',
-        ]
+        cmd = list(_ONEFILE_BASE_ARGS)
         
         # Ajouter les DLL Python explicitement
         for dll_path, dest in python_dlls:
@@ -551,45 +987,12 @@ def build_executable(debug=False, onefile=False):
             cmd.extend(['--add-data', f'{data_path};{dest}'])
         
         # Hidden imports essentiels avec focus sur la compatibilité CI
-        hidden_imports = [
-            'torch', 'torchaudio', 'demucs', 'demucs.separate', 'demucs.pretrained',
-            'soundfile', 'numpy', 'scipy', 'tkinter', 'tkinter.ttk', 
-            'tkinter.filedialog', 'tkinter.messagebox',
-            'rsrtools.files.welder', 'rsrtools.files.config', 'rsrtools.files.exceptions',
-            'torch.nn', 'torch.nn.functional', 'torch.optim', 'torch.utils', 'torch.utils.data',
-            'torch._C', 'torch._C._nn', 'torch._C._fft', 'torch._C._linalg', 'torch._C._sparse',
-            'torch.backends', 'torch.backends.cpu', 'torch.backends.mkl', 'torch.backends.mkldnn',
-            'torchaudio.transforms', 'torchaudio.functional', 'torchaudio.models', 
-            'torchaudio._extension', 'torchaudio.io',
-            'demucs.hdemucs', 'demucs.htdemucs', 'demucs.wdemucs', 'demucs.transformer',
-            'demucs.spec', 'demucs.states', 'demucs.utils', 'demucs.wav', 'demucs.audio',
-            'demucs.repo', 'demucs.apply',
-            # NumPy imports essentiels
-            'numpy.core', 'numpy.core.multiarray', 'numpy.core._multiarray_umath',
-            'numpy.core.multiarray_umath', 'numpy.core.numeric', 'numpy.core.umath',
-            'numpy._typing', 'numpy._typing._array_like', 'numpy._typing._dtype_like',
-            'numpy.lib', 'numpy.lib.recfunctions', 'numpy.ma', 'numpy.ma.core',
-            'numpy.random', 'numpy.random._pickle', 'numpy.linalg', 'numpy.fft',
-            'numpy.core._methods', 'numpy.core.arrayprint', 'numpy.core.fromnumeric',
-            'numpy.core.function_base', 'numpy.core.getlimits', 'numpy.core.shape_base',
-            # Dépendances Demucs pour CI
-            'diffq', 'einops', 'julius', 'openunmix', 'tqdm', 'omegaconf',
-            'hydra', 'hydra.core', 'hydra.core.config_store', 'hydra.core.global_hydra',
-            'dora', 'lameenc', 'packaging', 'setuptools', 'pkg_resources',
-            'dora_search',  # Nouvelle dépendance Demucs
-            # Imports supplémentaires pour éviter les erreurs CI
-            'typing_extensions', 'importlib_metadata', 'importlib_resources',
-            'antlr4', 'antlr4.tree', 'antlr4.error',  # Pour omegaconf
-        ]
-        
-        for import_name in hidden_imports:
-            cmd.extend(['--hidden-import', import_name])
+        cmd.extend(_ONEFILE_HIDDEN_IMPORT_ARGS)
         
         cmd.append('../gui/gui_main.py')
     else:
         # Pour onedir, utiliser le fichier .spec
         cmd = [
-            sys.executable, '-m', 'PyInstaller',
             '--clean',
             '--noconfirm'
         ]
@@ -600,17 +1003,25 @@ def build_executable(debug=False, onefile=False):
         
         cmd.append('rocksmith_gui.spec')
     
-    print(f"Commande: {' '.join(cmd)}")
+    print(f"Commande: pyinstaller {' '.join(cmd)}")
+    
+    # Exécuter PyInstaller dans le processus courant : pas de nouvel interpréteur
+    # à démarrer, et les imports de PyInstaller restent chauds entre deux builds
+    from PyInstaller import __main__ as pyi_main
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        print("OK Compilation reussie!")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"ERREUR Erreur de compilation:")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
+        pyi_main.run(cmd)
+    except SystemExit as e:
+        # PyInstaller termine via sys.exit() en cas d'erreur
+        if e.code not in (None, 0):
+            print(f"ERREUR Erreur de compilation (code {e.code})")
+            return False
+    except Exception as e:
+        print(f"ERREUR Erreur de compilation: {e}")
         return False
+    
+    print("OK Compilation reussie!")
+    return True
 
 
 def create_readme():
@@ -629,6 +1040,7 @@ RockSmith Guitar Mute is a tool that uses artificial intelligence to remove guit
 2. Run `RockSmithGuitarMute.exe`
 
 Note: No additional installation is required. This is a portable application.
+Keep the `models` folder next to `RockSmithGuitarMute.exe`: it contains the AI models.
 
 ## Usage
 
@@ -682,6 +1094,20 @@ This software is distributed under an open source license. See the LICENSE file
     print("OK README created: dist/README.txt")
 
 
+def _remove_and_measure(path):
+    """Supprime une arborescence en un seul parcours et retourne la taille libérée."""
+    total = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                total += _remove_and_measure(entry.path)
+            else:
+                total += entry.stat(follow_symlinks=False).st_size
+                _remove_with_retry(os.unlink, entry.path)
+    _remove_with_retry(os.rmdir, path)
+    return total
+
+
 def optimize_distribution():
     """Optimise la distribution en supprimant les fichiers inutiles."""
     print("Optimisation de la distribution...")
@@ -691,39 +1117,48 @@ def optimize_distribution():
         print("ERREUR Dossier de distribution non trouve!")
         return
     
-    # Fichiers et dossiers à supprimer pour réduire la taille
+    # Fichiers et dossiers à supprimer pour réduire la taille (motifs sur le nom, à toute profondeur)
     patterns_to_remove = [
-        '**/*.pyc',
-        '**/__pycache__',
-        '**/test*',
-        '**/tests',
-        '**/examples',
-        '**/docs',
-        '**/*.md',
-        '**/LICENSE*',
-        '**/CHANGELOG*',
-        '**/README*',
+        '*.pyc',
+        '__pycache__',
+        'test*',
+        'tests',
+        'examples',
+        'docs',
+        '*.md',
+        'LICENSE*',
+        'CHANGELOG*',
+        'README*',
         # Garder seulement notre README
     ]
     
+    # Un seul parcours de l'arborescence et une seule regex pour tous les motifs
+    flags = re.IGNORECASE if os.name == 'nt' else 0
+    remove_re = re.compile('|'.join(f'(?:{fnmatch.translate(p)})' for p in patterns_to_remove), flags)
+    
     removed_size = 0
     
-    for pattern in patterns_to_remove:
-        for item in dist_dir.glob(pattern):
-            if item.name == 'README.txt':  # Garder notre README
+    for root, dirs, files in os.walk(dist_dir):
+        for name in list(dirs):
+            if not remove_re.match(name):
                 continue
-                
+            dirs.remove(name)  # Ne pas descendre dans un dossier supprimé
+            path = os.path.join(root, name)
             try:
-                if item.is_file():
-                    size = item.stat().st_size
-                    item.unlink()
-                    removed_size += size
-                elif item.is_dir():
-                    size = sum(f.stat().st_size for f in item.rglob('*') if f.is_file())
-                    shutil.rmtree(item)
-                    removed_size += size
+                removed_size += _remove_and_measure(path)
             except Exception as e:
-                print(f"  ATTENTION Impossible de supprimer {item}: {e}")
+                print(f"  ATTENTION Impossible de supprimer {path}: {e}")
+        
+        for name in files:
+            if name == 'README.txt' or not remove_re.match(name):  # Garder notre README
+                continue
+            path = os.path.join(root, name)
+            try:
+                size = os.stat(path).st_size
+                os.unlink(path)
+                removed_size += size
+            except Exception as e:
+                print(f"  ATTENTION Impossible de supprimer {path}: {e}")
     
     print(f"OK Optimisation terminee! {removed_size / (1024*1024):.1f} MB economises")
 
@@ -736,6 +1171,7 @@ def main():
     parser.add_argument('--no-optimize', action='store_true', help='Pas d\'optimisation')
     parser.add_argument('--onefile', action='store_true', help='Créer un exécutable en un seul fichier (résout les problèmes de DLL)')
     parser.add_argument('--optimize', action='store_true', help='Optimiser la taille en excluant les dépendances inutiles (garde CUDA)')
+    parser.add_argument('--nuitka', action='store_true', help='Compiler avec Nuitka au lieu de PyInstaller (onefile, nécessite un compilateur C)')
     
     args = parser.parse_args()
     
@@ -746,6 +1182,7 @@ def main():
     clean_build_dirs()
     
     if args.clean_only:
+        invalidate_dll_index()
         print("OK Nettoyage termine!")
         return
     
@@ -759,23 +1196,30 @@ def main():
     if not check_dependencies():
         sys.exit(1)
     
-    # Création du fichier spec
-    create_pyinstaller_spec(onefile=args.onefile, debug=args.debug)
+    # Création du fichier spec (inutile avec Nuitka, toujours en onefile)
+    if args.nuitka:
+        args.onefile = True
+    else:
+        create_pyinstaller_spec(onefile=args.onefile, debug=args.debug)
+    
+    # Le README ne dépend pas de la sortie de PyInstaller : l'écrire pendant la compilation
+    Path('dist').mkdir(exist_ok=True)
+    readme_thread = threading.Thread(target=create_readme, name='create_readme')
+    readme_thread.start()
     
     # Compilation avec nos améliorations DLL
     print("Compilation avec inclusion forcee des DLL Python...")
-    if not build_executable(debug=args.debug, onefile=args.onefile):
+    build_ok = build_executable(debug=args.debug, onefile=args.onefile, nuitka=args.nuitka)
+    readme_thread.join()
+    if not build_ok:
         print("ERREUR Echec de la compilation!")
         sys.exit(1)
     
-    # Vérification du résultat (Windows a toujours l'extension .exe)
-    import platform
-    exe_extension = '.exe' if platform.system() == 'Windows' else ''
-    
+    # Vérification du résultat
     if args.onefile:
-        exe_path = Path(f'dist/RockSmithGuitarMute{exe_extension}')
+        exe_path = Path(f'dist/RockSmithGuitarMute{_EXE_EXTENSION}')
     else:
-        exe_path = Path(f'dist/RockSmithGuitarMute/RockSmithGuitarMute{exe_extension}')
+        exe_path = Path(f'dist/RockSmithGuitarMute/RockSmithGuitarMute{_EXE_EXTENSION}')
     
     if not exe_path.exists():
         print("ERREUR Executable non trouve apres compilation!")
@@ -791,18 +1235,19 @@ def main():
     print(f"OK Executable cree: {exe_path}")
     print(f"   Taille: {exe_path.stat().st_size / (1024*1024):.1f} MB")
     
+    # Modèles Demucs livrés à côté de l'exécutable plutôt qu'embarqués dedans
+    copy_demucs_models(exe_path.parent)
+    
     # Optimisation
     if not args.no_optimize:
         optimize_distribution()
     
-    # Création des fichiers additionnels
-    create_readme()
-    
     print("\nOK Compilation terminee avec succes!")
     print(f"Distribution disponible dans: {Path('dist').absolute()}")
     print("\nFichiers crees:")
-    print("  - RockSmithGuitarMute.exe (application principale)")
+    print(f"  - RockSmithGuitarMute{_EXE_EXTENSION} (application principale)")
     print("  - README.txt (documentation)")
+    print("  - models/ (modeles Demucs, a garder a cote de l'executable)")
     
     print("\nPour distribuer:")
     print("  1. Compressez le dossier 'dist' en ZIP")
@@ -6,350 +6,655 @@ Garde le support CUDA mais supprime les dépendances inutiles
 
 import sys
 import os
+import re
+import shutil
+import json
+import hashlib
+import fnmatch
 import subprocess
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
+# Noms de modèles Demucs à embarquer, compilés une seule fois en alternance
+# (une recherche par fichier au lieu d'un test de sous-chaîne par nom)
+_DEMUCS_MODEL_NAMES = ('htdemucs', 'mdx', 'demucs')
+# Les checkpoints téléchargés par Demucs sont nommés <signature>-<checksum>.th
+_DEMUCS_MODEL_RE = re.compile('|'.join(map(re.escape, _DEMUCS_MODEL_NAMES)) + r'|^[0-9a-f]{8}-[0-9a-f]{8}\.th$')
+
+# Runtime VC redistribuable à embarquer (comparaison insensible à la casse, comme NTFS).
+# Jamais de DLL du système (kernel32, user32, ucrtbase, api-ms-win-*) copiées depuis
+# la machine de build
+_SYSTEM_DLLS = (
+    "vcruntime140.dll",
+    "msvcp140.dll",
+)
+_SYSTEM_DLL_NAMES = frozenset(_SYSTEM_DLLS)
+
+# DLL PyTorch/TorchAudio critiques : motifs glob fusionnés en une regex par bibliothèque
+_TORCH_DLL_RE = re.compile(
+    '|'.join(f'(?:{fnmatch.translate(p)})' for p in ("torch_cpu.dll", "torch_*.dll", "c10.dll", "fbgemm.dll")),
+    re.IGNORECASE,
+)
+_TORCHAUDIO_DLL_RE = re.compile(
+    '|'.join(f'(?:{fnmatch.translate(p)})' for p in ("torchaudio*.dll", "sox*.dll")),
+    re.IGNORECASE,
+)
+
+# Index persistant des modèles Demucs trouvés dans les caches torch
+_MODELS_INDEX_FILE = os.path.join(os.path.expanduser("~"), ".cache", "rocksmith_build", "models.json")
+
+def _iter_files(root, suffix=None):
+    """Parcourt récursivement root avec os.scandir et produit les fichiers (os.DirEntry)."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, suffix)
+            elif (suffix is None or entry.name.endswith(suffix)) and entry.is_file(follow_symlinks=False):
+                yield entry
+
+def _is_system_dll(name):
+    """Indique si name est une des DLL système à embarquer."""
+    return name.lower() in _SYSTEM_DLL_NAMES
+
+def _package_dir(name):
+    """Dossier d'installation d'un paquet, trouvé sans exécuter son __init__ (None s'il est absent)."""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None:
+        return None
+    if spec.origin:
+        return os.path.dirname(spec.origin)
+    # Paquet namespace : pas de fichier d'origine, prendre son premier dossier
+    locations = list(spec.submodule_search_locations or ())
+    return locations[0] if locations else None
+
+@lru_cache(maxsize=None)
+def _listdir(directory):
+    """Contenu d'un dossier lu en un seul os.scandir : {nom normalisé: DirEntry} ({} s'il est absent)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name): entry for entry in entries}
+    except OSError:
+        return {}
+
+def _lookup_file(path):
+    """Équivalent de os.path.isfile via l'instantané du dossier parent."""
+    entry = _listdir(os.path.dirname(path)).get(os.path.normcase(os.path.basename(path)))
+    return entry is not None and entry.is_file()
+
+def _lookup_dir(path):
+    """Équivalent de os.path.isdir via l'instantané du dossier parent."""
+    entry = _listdir(os.path.dirname(path)).get(os.path.normcase(os.path.basename(path)))
+    return entry is not None and entry.is_dir()
+
+def _probe_dir(directory, matches):
+    """Liste en un seul os.scandir les fichiers de directory dont le nom satisfait matches."""
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        return [(entry.name, entry.path) for entry in entries
+                if matches(entry.name) and entry.is_file()]
+
+@lru_cache(maxsize=None)
 def get_python_dll_paths():
     """Récupère les chemins des DLL Python nécessaires - VERSION AMELIOREE."""
     import sys
     import os
     
     python_dll_paths = []
+    lines = []  # Sortie regroupée en une seule écriture
     
-    # Chemin de l'installation Python
-    python_dir = Path(sys.executable).parent
+    # Chemin de l'installation Python (chaînes os.path : pas d'objet Path par candidat)
+    python_dir = os.path.dirname(sys.executable)
+    python_parent = os.path.dirname(python_dir)
+    base_prefix = sys.base_prefix
     
     # Debug: afficher les chemins Python
-    print(f"DEBUG: Python executable: {sys.executable}")
-    print(f"DEBUG: Python directory: {python_dir}")
-    print(f"DEBUG: Python version: {sys.version}")
+    lines.append(f"DEBUG: Python executable: {sys.executable}")
+    lines.append(f"DEBUG: Python directory: {python_dir}")
+    lines.append(f"DEBUG: Python version: {sys.version}")
     
     # Vérifier si on est dans un environnement CI
     is_ci = os.environ.get('GITHUB_ACTIONS') == 'true'
     if is_ci:
-        print("DEBUG: Running in GitHub Actions CI environment")
+        lines.append("DEBUG: Running in GitHub Actions CI environment")
     
     # DLL Python principale - recherche exhaustive
     python_version = f"python{sys.version_info.major}{sys.version_info.minor}"
     
     # Emplacements possibles pour la DLL Python principale
     possible_locations = [
-        python_dir / f"{python_version}.dll",
-        python_dir.parent / "DLLs" / f"{python_version}.dll",
-        Path(sys.base_prefix) / f"{python_version}.dll",
-        Path(sys.base_prefix) / "DLLs" / f"{python_version}.dll",
-        Path(sys.executable).parent / f"{python_version}.dll",
+        os.path.join(python_dir, f"{python_version}.dll"),
+        os.path.join(python_parent, "DLLs", f"{python_version}.dll"),
+        os.path.join(base_prefix, f"{python_version}.dll"),
+        os.path.join(base_prefix, "DLLs", f"{python_version}.dll"),
         # Recherche dans System32 pour les installations système
-        Path(os.environ.get('SYSTEMROOT', 'C:\\Windows')) / "System32" / f"{python_version}.dll",
+        os.path.join(os.environ.get('SYSTEMROOT', 'C:\\Windows'), "System32", f"{python_version}.dll"),
     ]
     
     python_dll_found = False
     for python_dll in possible_locations:
-        if python_dll.exists():
-            python_dll_paths.append((str(python_dll), '.'))
-            print(f"DEBUG: Found main Python DLL: {python_dll}")
+        if _lookup_file(python_dll):
+            python_dll_paths.append((python_dll, '.'))
+            lines.append(f"DEBUG: Found main Python DLL: {python_dll}")
             python_dll_found = True
             break
     
     if not python_dll_found:
-        print(f"WARNING: Main Python DLL {python_version}.dll not found in any location!")
-        # En dernier recours, chercher toute DLL python*.dll
-        for search_dir in [python_dir, python_dir.parent, Path(sys.base_prefix)]:
-            if search_dir.exists():
-                for dll_file in search_dir.rglob("python*.dll"):
-                    python_dll_paths.append((str(dll_file), '.'))
-                    print(f"DEBUG: Found fallback Python DLL: {dll_file}")
-                    python_dll_found = True
+        lines.append(f"WARNING: Main Python DLL {python_version}.dll not found in any location!")
+        search_dirs = [python_dir, python_parent, base_prefix]
+        
+        # La DLL exacte testée directement avant tout parcours récursif
+        # (jamais python3.dll ni pythonXY_d.dll : ce ne sont pas la DLL principale)
+        main_dll_name = f"{python_version}.dll"
+        fallback_candidates = [
+            os.path.join(search_dir, main_dll_name)
+            for search_dir in search_dirs + [os.path.join(base_prefix, "DLLs")]
+        ]
+        fallback_dll = next((c for c in fallback_candidates if _lookup_file(c)), None)
+        
+        # En dernier recours, chercher pythonXY.dll récursivement (arrêt au premier résultat)
+        if fallback_dll is None:
+            for search_dir in search_dirs:
+                if os.path.isdir(search_dir):
+                    fallback_dll = next((entry.path for entry in _iter_files(search_dir, ".dll")
+                                         if entry.name.lower() == main_dll_name), None)
+                if fallback_dll is not None:
                     break
-            if python_dll_found:
-                break
+        
+        if fallback_dll is not None:
+            python_dll_paths.append((fallback_dll, '.'))
+            lines.append(f"DEBUG: Found fallback Python DLL: {fallback_dll}")
+            python_dll_found = True
     
     # DLLs dans le dossier DLLs
-    dlls_dir = python_dir / "DLLs"
-    if dlls_dir.exists():
+    dlls_dir = os.path.join(python_dir, "DLLs")
+    if _lookup_dir(dlls_dir):
         dll_count = 0
-        for dll_file in dlls_dir.glob("*.dll"):
-            python_dll_paths.append((str(dll_file), 'DLLs'))
-            dll_count += 1
-        print(f"DEBUG: Found {dll_count} DLLs in {dlls_dir}")
+        for entry in _listdir(dlls_dir).values():
+            if entry.name.endswith('.dll'):
+                python_dll_paths.append((entry.path, 'DLLs'))
+                dll_count += 1
+        lines.append(f"DEBUG: Found {dll_count} DLLs in {dlls_dir}")
     else:
-        print(f"DEBUG: DLLs directory not found at: {dlls_dir}")
+        lines.append(f"DEBUG: DLLs directory not found at: {dlls_dir}")
         # Recherche alternative pour les DLL
         if is_ci:
             alt_dlls_dirs = [
-                python_dir.parent / "DLLs",
-                Path(sys.base_prefix) / "DLLs"
+                os.path.join(python_parent, "DLLs"),
+                os.path.join(base_prefix, "DLLs")
             ]
             for alt_dir in alt_dlls_dirs:
-                if alt_dir.exists():
+                if _lookup_dir(alt_dir):
                     dll_count = 0
-                    for dll_file in alt_dir.glob("*.dll"):
-                        python_dll_paths.append((str(dll_file), 'DLLs'))
-                        dll_count += 1
-                    print(f"DEBUG: Found {dll_count} DLLs in alternative location: {alt_dir}")
+                    for entry in _listdir(alt_dir).values():
+                        if entry.name.endswith('.dll'):
+                            python_dll_paths.append((entry.path, 'DLLs'))
+                            dll_count += 1
+                    lines.append(f"DEBUG: Found {dll_count} DLLs in alternative location: {alt_dir}")
                     break
     
-    # Bibliothèques système importantes
-    system_dlls = [
-        "vcruntime140.dll",
-        "msvcp140.dll", 
-        "api-ms-win-crt-runtime-l1-1-0.dll",
-        "ucrtbase.dll",
-        "kernel32.dll",
-        "user32.dll"
-    ]
-    
     # Chercher dans System32 et SysWOW64
+    system_root = os.environ.get('SYSTEMROOT', 'C:\\Windows')
     system_dirs = [
-        Path(os.environ.get('SYSTEMROOT', 'C:\\Windows')) / "System32",
-        Path(os.environ.get('SYSTEMROOT', 'C:\\Windows')) / "SysWOW64"
+        os.path.join(system_root, "System32"),
+        os.path.join(system_root, "SysWOW64")
     ]
     
+    # Dossiers PyTorch et TorchAudio contenant les DLL critiques
+    torch_lib_dirs = []
+    torchaudio_lib_dirs = []
+    # Localisés via find_spec, sans import : pas de chargement des DLL CUDA pour lire un chemin
+    torch_dir = _package_dir('torch')
+    torchaudio_dir = _package_dir('torchaudio')
+    torch_available = torch_dir is not None and torchaudio_dir is not None
+    if torch_available:
+        torch_lib_dirs = [os.path.join(torch_dir, "lib"), os.path.join(torch_dir, "bin"), torch_dir]
+        torchaudio_lib_dirs = [os.path.join(torchaudio_dir, "lib"), os.path.join(torchaudio_dir, "bin"), torchaudio_dir]
+    
+    # Sonder tous les dossiers en parallèle : un os.scandir par dossier, E/S indépendantes
+    probe_tasks = (
+        [(system_dir, _is_system_dll) for system_dir in system_dirs]
+        + [(lib_dir, _TORCH_DLL_RE.match) for lib_dir in torch_lib_dirs]
+        + [(lib_dir, _TORCHAUDIO_DLL_RE.match) for lib_dir in torchaudio_lib_dirs]
+    )
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        probe_results = list(executor.map(lambda task: _probe_dir(*task), probe_tasks))
+    system_results = probe_results[:len(system_dirs)]
+    torch_results = probe_results[len(system_dirs):len(system_dirs) + len(torch_lib_dirs)]
+    torchaudio_results = probe_results[len(system_dirs) + len(torch_lib_dirs):]
+    
     system_dll_count = 0
-    for system_dir in system_dirs:
-        if system_dir.exists():
-            for dll_name in system_dlls:
-                dll_path = system_dir / dll_name
-                if dll_path.exists():
-                    python_dll_paths.append((str(dll_path), '.'))
-                    system_dll_count += 1
-                    break  # Prendre seulement la première occurrence
-    print(f"DEBUG: Found {system_dll_count}/{len(system_dlls)} system DLLs")
+    remaining = set(_SYSTEM_DLL_NAMES)
+    for found in system_results:
+        for dll_name, dll_path in found:
+            if dll_name.lower() in remaining:
+                python_dll_paths.append((dll_path, '.'))
+                remaining.discard(dll_name.lower())  # Prendre seulement la première occurrence
+                system_dll_count += 1
+    lines.append(f"DEBUG: Found {system_dll_count}/{len(_SYSTEM_DLLS)} system DLLs")
     
     # Rechercher les DLL spécifiques à PyTorch et TorchAudio
-    try:
-        import torch
-        import torchaudio
-        
-        torch_dir = Path(torch.__file__).parent
-        torchaudio_dir = Path(torchaudio.__file__).parent
+    if torch_available:
+        torch_dlls = []
+        # Tout va dans '.' : une DLL présente dans lib/ et bin/ (ou déjà ajoutée) n'est gardée qu'une fois
+        seen_names = {os.path.basename(path).lower() for path, dest in python_dll_paths if dest == '.'}
         
         # DLL PyTorch critiques
-        torch_dlls = []
-        for torch_lib_dir in [torch_dir / "lib", torch_dir / "bin", torch_dir]:
-            if torch_lib_dir.exists():
-                for dll_pattern in ["torch_cpu.dll", "torch_*.dll", "c10.dll", "fbgemm.dll"]:
-                    for dll_file in torch_lib_dir.glob(dll_pattern):
-                        torch_dlls.append((str(dll_file), '.'))
-                        print(f"DEBUG: Found PyTorch DLL: {dll_file.name}")
+        for found in torch_results:
+            for dll_name, dll_path in found:
+                if dll_name.lower() in seen_names:
+                    continue
+                seen_names.add(dll_name.lower())
+                torch_dlls.append((dll_path, '.'))
+                lines.append(f"DEBUG: Found PyTorch DLL: {dll_name}")
         
-        # DLL TorchAudio critiques  
-        for torchaudio_lib_dir in [torchaudio_dir / "lib", torchaudio_dir / "bin", torchaudio_dir]:
-            if torchaudio_lib_dir.exists():
-                for dll_pattern in ["torchaudio*.dll", "sox*.dll"]:
-                    for dll_file in torchaudio_lib_dir.glob(dll_pattern):
-                        torch_dlls.append((str(dll_file), '.'))
-                        print(f"DEBUG: Found TorchAudio DLL: {dll_file.name}")
+        # DLL TorchAudio critiques
+        for found in torchaudio_results:
+            for dll_name, dll_path in found:
+                if dll_name.lower() in seen_names:
+                    continue
+                seen_names.add(dll_name.lower())
+                torch_dlls.append((dll_path, '.'))
+                lines.append(f"DEBUG: Found TorchAudio DLL: {dll_name}")
         
         python_dll_paths.extend(torch_dlls)
-        print(f"DEBUG: Found {len(torch_dlls)} PyTorch/TorchAudio DLLs")
-        
-    except ImportError:
-        print("DEBUG: PyTorch/TorchAudio not available for DLL detection")
+        lines.append(f"DEBUG: Found {len(torch_dlls)} PyTorch/TorchAudio DLLs")
+    else:
+        lines.append("DEBUG: PyTorch/TorchAudio not available for DLL detection")
     
     # Vérification finale
     total_dlls = len(python_dll_paths)
-    print(f"DEBUG: Total DLLs found: {total_dlls}")
+    lines.append(f"DEBUG: Total DLLs found: {total_dlls}")
     
     if total_dlls < 5:  # Minimum attendu
-        print("WARNING: Very few DLLs found - this may cause runtime errors!")
-        print("This could explain the 'Failed to load Python DLL' error.")
+        lines.append("WARNING: Very few DLLs found - this may cause runtime errors!")
+        lines.append("This could explain the 'Failed to load Python DLL' error.")
     
-    return python_dll_paths
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return tuple(python_dll_paths)
 
+def _find_demucs_models(model_locations):
+    """Liste les modèles Demucs (chemin, taille) des caches, via un index persistant."""
+    # Empreinte = filtre + mtime des dossiers de cache (change dès qu'un modèle est ajouté/supprimé)
+    fingerprint = _DEMUCS_MODEL_RE.pattern + '|' + '|'.join(
+        f"{d}:{os.stat(d).st_mtime_ns}" for d in model_locations if os.path.isdir(d))
+    key = hashlib.md5(fingerprint.encode('utf-8')).hexdigest()
+    
+    try:
+        with open(_MODELS_INDEX_FILE, encoding='utf-8') as f:
+            index = json.load(f)
+        if index['key'] == key and all(os.path.isfile(path) for path, _ in index['models']):
+            print(f"DEBUG: Demucs models read from index {_MODELS_INDEX_FILE}")
+            return [tuple(model) for model in index['models']]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    models = []
+    seen = set()
+    for cache_dir in model_locations:
+        if os.path.isdir(cache_dir):
+            print(f"DEBUG: Searching in {cache_dir}")
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    # Vérifier si c'est un modèle Demucs
+                    if not (entry.name.endswith(".th") and _DEMUCS_MODEL_RE.search(entry.name)):
+                        continue
+                    # Même fichier vu par deux caches (lien symbolique/physique) : ne l'inclure qu'une fois
+                    st = os.stat(entry.path)
+                    file_id = (st.st_dev, st.st_ino)
+                    if file_id in seen:
+                        continue
+                    seen.add(file_id)
+                    models.append((entry.path, st.st_size))
+    
+    try:
+        os.makedirs(os.path.dirname(_MODELS_INDEX_FILE), exist_ok=True)
+        tmp_file = _MODELS_INDEX_FILE + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'models': models}, f)
+        os.replace(tmp_file, _MODELS_INDEX_FILE)
+    except OSError as e:
+        print(f"WARNING: Could not write models index: {e}")
+    return models
+
+@lru_cache(maxsize=None)
 def get_demucs_data_files():
     """Récupère les fichiers de données Demucs nécessaires."""
     try:
         import demucs
-        import torch
-        demucs_path = Path(demucs.__file__).parent
+        demucs_path = os.path.dirname(demucs.__file__)
         
         data_files = []
         
+        # Destination = dossier parent relatif à site-packages, par simple découpe de chaîne
+        base_len = len(os.path.dirname(demucs_path)) + 1
+        
         # Fichiers de configuration
-        conf_dir = demucs_path / "conf"
-        if conf_dir.exists():
-            for conf_file in conf_dir.rglob("*.yaml"):
-                rel_path = conf_file.relative_to(demucs_path.parent)
-                data_files.append((str(conf_file), str(rel_path.parent)))
+        conf_dir = os.path.join(demucs_path, "conf")
+        if os.path.isdir(conf_dir):
+            for conf_entry in _iter_files(conf_dir, ".yaml"):
+                data_files.append((conf_entry.path, os.path.dirname(conf_entry.path)[base_len:]))
         
         # Fichiers remote
-        remote_dir = demucs_path / "remote"
-        if remote_dir.exists():
-            for remote_file in remote_dir.rglob("*"):
-                if remote_file.is_file():
-                    rel_path = remote_file.relative_to(demucs_path.parent)
-                    data_files.append((str(remote_file), str(rel_path.parent)))
-        
-        # Inclure les modèles Demucs téléchargés
-        print("DEBUG: Searching for Demucs models...")
-        model_locations = [
-            Path.home() / ".cache" / "torch" / "hub" / "checkpoints",
-            Path.home() / "AppData" / "Local" / "torch" / "hub" / "checkpoints",
-            Path.home() / ".torch" / "models",
-        ]
+        remote_dir = os.path.join(demucs_path, "remote")
+        if os.path.isdir(remote_dir):
+            for remote_entry in _iter_files(remote_dir):
+                data_files.append((remote_entry.path, os.path.dirname(remote_entry.path)[base_len:]))
         
-        model_count = 0
-        for cache_dir in model_locations:
-            if cache_dir.exists():
-                print(f"DEBUG: Searching in {cache_dir}")
-                for model_file in cache_dir.glob("*.th"):
-                    # Vérifier si c'est un modèle Demucs
-                    if any(model_name in model_file.name for model_name in ['htdemucs', 'mdx', 'demucs']):
-                        data_files.append((str(model_file), 'torch_models'))
-                        model_count += 1
-                        print(f"DEBUG: Including model: {model_file.name} ({model_file.stat().st_size / (1024*1024):.1f} MB)")
-        
-        print(f"DEBUG: Found {model_count} Demucs model files")
-        if model_count == 0:
-            print("WARNING: No Demucs models found! The application may not work properly.")
+        # Les modèles Demucs ne sont plus embarqués ici : ils sont livrés à côté de
+        # l'exécutable (voir copy_demucs_models) et lus sur place via TORCH_HOME
         
-        return data_files
+        return tuple(data_files)
     except ImportError:
-        return []
+        return ()
 
-def get_optimized_excludes():
-    """Retourne la liste des modules à exclure pour réduire la taille."""
-    excludes = [
-        # Packages de visualisation (pas utilisés)
-        'matplotlib', 'seaborn', 'plotly', 'bokeh',
-        
-        # Packages de data science (pas utilisés) 
-        'pandas', 'sklearn', 'scikit-learn', 'statsmodels',
-        
-        # Computer vision (pas utilisé)
-        'cv2', 'opencv', 'PIL', 'Pillow', 'skimage',
-        
-        # Jupyter et notebooks
-        'jupyter', 'notebook', 'IPython', 'ipykernel', 'ipywidgets',
-        
-        # Documentation et exemples
-        'sphinx', 'docutils',
-        
-        # Packages optionnels de PyTorch
-        'torchvision',  # Vision - pas utilisé pour audio
-        'torchtext',    # Text - pas utilisé
-        
-        # Autres packages lourds optionnels
-        'sympy',        # Mathématiques symboliques
-        'networkx',     # Graphes
-        'h5py',         # HDF5
-        'tables',       # PyTables
+@lru_cache(maxsize=None)
+def get_demucs_model_files():
+    """Récupère les modèles Demucs téléchargés (chemin, taille) à livrer avec l'exécutable."""
+    print("DEBUG: Searching for Demucs models...")
+    home = os.path.expanduser("~")
+    model_locations = [
+        os.path.join(home, ".cache", "torch", "hub", "checkpoints"),
+        os.path.join(home, "AppData", "Local", "torch", "hub", "checkpoints"),
+        os.path.join(home, ".torch", "models"),
     ]
     
-    # NE PAS exclure pkg_resources et ses dépendances (jaraco.text, etc.)
-    # NE PAS exclure setuptools (nécessaire pour pkg_resources)
+    models = tuple(_find_demucs_models(model_locations))
+    for model_path, model_size in models:
+        print(f"DEBUG: Including model: {os.path.basename(model_path)} ({model_size / (1024*1024):.1f} MB)")
     
-    return excludes
+    print(f"DEBUG: Found {len(models)} Demucs model files")
+    if not models:
+        print("WARNING: No Demucs models found! The application may not work properly.")
+    return models
 
+def copy_demucs_models(target_dir):
+    """Copie les modèles Demucs dans target_dir/models/hub/checkpoints (disposition attendue par torch.hub)."""
+    checkpoints_dir = os.path.join(target_dir, "models", "hub", "checkpoints")
+    os.makedirs(checkpoints_dir, exist_ok=True)
+    
+    copied = 0
+    for model_path, model_size in get_demucs_model_files():
+        dest = os.path.join(checkpoints_dir, os.path.basename(model_path))
+        # Déjà présent (build précédent non nettoyé) : inutile de recopier des centaines de Mo
+        if os.path.isfile(dest) and os.path.getsize(dest) == model_size:
+            continue
+        shutil.copy2(model_path, dest)
+        copied += 1
+    
+    print(f"OK {copied} modele(s) Demucs copie(s) dans {checkpoints_dir}")
+    return checkpoints_dir
+
+# Modules à exclure pour réduire la taille (noms de modules, dédoublonnés en conservant l'ordre)
+# NE PAS exclure pkg_resources et ses dépendances (jaraco.text, etc.)
+# NE PAS exclure setuptools (nécessaire pour pkg_resources)
+_EXCLUDES = tuple(dict.fromkeys([
+    # Packages de visualisation (pas utilisés)
+    'matplotlib', 'seaborn', 'plotly', 'bokeh',
+
+    # Packages de data science (pas utilisés)
+    'pandas', 'sklearn', 'statsmodels',
+
+    # Computer vision (pas utilisé)
+    'cv2', 'PIL', 'skimage',
+
+    # Jupyter et notebooks
+    'jupyter', 'notebook', 'IPython', 'ipykernel', 'ipywidgets',
+
+    # Documentation et exemples
+    'sphinx', 'docutils',
+
+    # Packages optionnels de PyTorch
+    'torchvision',  # Vision - pas utilisé pour audio
+    'torchtext',    # Text - pas utilisé
+
+    # Autres packages lourds optionnels
+    'sympy',        # Mathématiques symboliques
+    'networkx',     # Graphes
+    'h5py',         # HDF5
+    'tables',       # PyTables
+]))
+
+# Imports cachés nécessaires (minimaux), dédoublonnés en conservant l'ordre
+_HIDDEN_IMPORTS = tuple(dict.fromkeys([
+    # Core PyTorch (garder CUDA)
+    'torch', 'torch.cuda', 'torch.nn', 'torch.optim',
+    'torchaudio', 'torchaudio.transforms',
+
+    # Demucs (nécessaire)
+    'demucs', 'demucs.separate', 'demucs.pretrained', 'demucs.api',
+
+    # Audio processing
+    'soundfile', 'numpy', 'scipy.signal',
+
+    # Imports NumPy pour résoudre numpy.core.multiarray
+    'numpy.core',
+    'numpy.core.multiarray',
+    'numpy.core._multiarray_umath',
+    'numpy.core.multiarray_umath',
+    'numpy._typing',
+    'numpy._typing._array_like',
+    'numpy._typing._dtype_like',
+    'numpy.lib',
+    'numpy.lib.recfunctions',
+    'numpy.ma',
+    'numpy.ma.core',
+    'numpy.random',
+    'numpy.random._pickle',
+    'numpy.linalg',
+    'numpy.fft',
+
+    # GUI
+    'tkinter', 'tkinter.ttk', 'tkinter.filedialog', 'tkinter.messagebox',
+
+    # System
+    'threading', 'queue', 'multiprocessing', 'concurrent.futures',
+    'pathlib', 'shutil', 'tempfile', 'subprocess', 'logging',
+
+    # Package management (nécessaire pour éviter les erreurs)
+    'pkg_resources', 'setuptools', 'jaraco.text', 'jaraco.functools',
+
+    # Project specific
+    'rsrtools.files.welder', 'rsrtools.files.config', 'rsrtools.files.exceptions',
+]))
+
+@lru_cache(maxsize=None)
+def get_optimized_excludes():
+    """Retourne la liste des modules à exclure pour réduire la taille."""
+    return _EXCLUDES
+
+@lru_cache(maxsize=None)
 def get_optimized_hidden_imports():
     """Retourne les imports cachés nécessaires (minimaux)."""
-    hidden_imports = [
-        # Core PyTorch (garder CUDA)
-        'torch', 'torch.cuda', 'torch.nn', 'torch.optim',
-        'torchaudio', 'torchaudio.transforms',
-        
-        # Demucs (nécessaire)
-        'demucs', 'demucs.separate', 'demucs.pretrained', 'demucs.api',
-        
-        # Audio processing
-        'soundfile', 'numpy', 'scipy.signal',
-        
-        # Imports NumPy pour résoudre numpy.core.multiarray
-        'numpy.core',
-        'numpy.core.multiarray',
-        'numpy.core._multiarray_umath',
-        'numpy.core.multiarray_umath',
-        'numpy._typing',
-        'numpy._typing._array_like',
-        'numpy._typing._dtype_like',
-        'numpy.lib',
-        'numpy.lib.recfunctions',
-        'numpy.ma',
-        'numpy.ma.core',
-        'numpy.random',
-        'numpy.random._pickle',
-        'numpy.linalg',
-        'numpy.fft',
-        
-        # GUI
-        'tkinter', 'tkinter.ttk', 'tkinter.filedialog', 'tkinter.messagebox',
-        
-        # System
-        'threading', 'queue', 'multiprocessing', 'concurrent.futures',
-        'pathlib', 'shutil', 'tempfile', 'subprocess', 'logging',
-        
-        # Package management (nécessaire pour éviter les erreurs)
-        'pkg_resources', 'setuptools', 'jaraco.text', 'jaraco.functools',
-        
-        # Project specific
-        'rsrtools.files.welder', 'rsrtools.files.config', 'rsrtools.files.exceptions',
-    ]
+    return _HIDDEN_IMPORTS
+
+def _clear_caches():
+    """Vide les caches de découverte (après installation de nouveaux modèles/DLL)."""
+    get_python_dll_paths.cache_clear()
+    _listdir.cache_clear()
+    get_demucs_data_files.cache_clear()
+    get_demucs_model_files.cache_clear()
+    get_optimized_excludes.cache_clear()
+    get_optimized_hidden_imports.cache_clear()
+    _discover_all.cache_clear()
+
+# Données du projet embarquées dans l'exécutable
+_PROJECT_DATAS = [
+    ('../rs-utils', 'rs-utils'),
+    ('../rsrtools/src/rsrtools', 'rsrtools'),
+    ('../demucs/demucs', 'demucs'),
+    ('../demucs/conf', 'demucs/conf'),
+    ('../audio2wem_windows.py', '.'),
+]
+
+_OPTIMIZED_SPEC_TEMPLATE = '''# -*- mode: python ; coding: utf-8 -*-
+# Généré par optimize_build.py - ne pas modifier
+
+import os
+import json
+from PyInstaller import __version__ as pyinstaller_version
+
+with open(os.path.join(SPECPATH, 'optimized_build_data.json'), encoding='utf-8') as f:
+    build_data = json.load(f)
+
+# optimize= (niveau de bytecode, -O ou -OO) n'existe qu'à partir de PyInstaller 6
+analysis_options = {}
+if int(pyinstaller_version.split('.')[0]) >= 6:
+    analysis_options['optimize'] = build_data['optimize']
+
+a = Analysis(
+    ['../gui/gui_main.py'],
+    pathex=[],
+    binaries=[tuple(item) for item in build_data['binaries']],
+    datas=[tuple(item) for item in build_data['datas']],
+    hiddenimports=build_data['hidden_imports'],
+    hookspath=['../hooks'],  # Hook pour NumPy
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=build_data['excludes'],
+    noarchive=False,
+    **analysis_options,
+)
+
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='RockSmithGuitarMute',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=build_data['strip'],  # Symboles de debug supprimés seulement si strip est disponible
+    upx=build_data['upx'],  # UPX seulement s'il est installé, hors DLL sensibles
+    upx_exclude=build_data['upx_exclude'],
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+'''
+
+def _emit_spec(excludes, hidden_imports, binaries, datas, binary_options):
+    """Écrit le .spec onefile optimisé et son fichier de données JSON.
+    
+    Retourne le chemin du .spec et un booléen indiquant si les entrées ont changé
+    depuis le dernier build (empreinte SHA-256 conservée dans <spec>.sha256).
+    """
+    build_data = {
+        'excludes': list(excludes),
+        'hidden_imports': list(hidden_imports),
+        'binaries': list(binaries),
+        'datas': list(datas),
+        **binary_options,
+    }
+    build_data_json = json.dumps(build_data, sort_keys=True)
+    digest = hashlib.sha256((_OPTIMIZED_SPEC_TEMPLATE + build_data_json).encode('utf-8')).hexdigest()
     
-    return hidden_imports
+    spec_path = Path('RockSmithGuitarMute_optimized.spec')
+    hash_path = spec_path.with_name(spec_path.name + '.sha256')
+    try:
+        changed = hash_path.read_text(encoding='utf-8').strip() != digest or not spec_path.exists()
+    except OSError:
+        changed = True
+    
+    if changed:
+        with open('optimized_build_data.json', 'w', encoding='utf-8') as f:
+            f.write(build_data_json)
+        spec_path.write_text(_OPTIMIZED_SPEC_TEMPLATE, encoding='utf-8')
+        hash_path.write_text(digest, encoding='utf-8')
+        print(f"Fichier {spec_path} cree")
+    else:
+        print(f"Fichier {spec_path} inchange")
+    return spec_path, changed
+
+@lru_cache(maxsize=1)
+def _discover_all(prefix, version):
+    """Résultats de découverte pour un interpréteur donné (prefix, version), calculés une fois par processus.
+    
+    Un changement d'interpréteur manque le cache et vide au passage les caches de découverte.
+    """
+    _clear_caches()
+    return (get_python_dll_paths(), get_demucs_data_files(),
+            get_optimized_excludes(), get_optimized_hidden_imports())
 
 def build_optimized_onefile():
-    """Compile un exécutable onefile optimisé AVEC DLL et modèles inclus."""
+    """Compile un exécutable onefile optimisé AVEC DLL incluses (modèles livrés à côté)."""
     print("Compilation optimisee pour reduire la taille...")
     print("Support CUDA conserve")
-    print("Inclusion des DLL Python et modeles Demucs...")
+    print("Inclusion des DLL Python et fichiers Demucs...")
     
-    excludes = get_optimized_excludes()
-    hidden_imports = get_optimized_hidden_imports()
-    python_dlls = get_python_dll_paths()
-    demucs_data = get_demucs_data_files()
+    python_dlls, demucs_data, excludes, hidden_imports = map(
+        list, _discover_all(sys.prefix, sys.version_info[:2]))
     
     print(f"Exclusion de {len(excludes)} modules inutiles")
     print(f"Inclusion de {len(hidden_imports)} imports essentiels")
     print(f"Inclusion de {len(python_dlls)} DLL Python/système")
-    print(f"Inclusion de {len(demucs_data)} fichiers Demucs (dont modèles)")
+    print(f"Inclusion de {len(demucs_data)} fichiers de configuration Demucs")
     
-    # Construire la commande PyInstaller
-    cmd = [
-        sys.executable, '-m', 'PyInstaller',
-        '--clean', '--noconfirm', '--onefile', '--windowed',
-        '--name', 'RockSmithGuitarMute',
-        
-        # Données nécessaires
-        '--add-data', '../rs-utils;rs-utils',
-        '--add-data', '../rsrtools/src/rsrtools;rsrtools', 
-        '--add-data', '../demucs/demucs;demucs',
-        '--add-data', '../demucs/conf;demucs/conf',
-        '--add-data', '../audio2wem_windows.py;.',
-        
-        # Hook pour NumPy
-        '--additional-hooks-dir', '../hooks',
-        
-        # Optimisations de taille (mais pas trop agressives)
-        '--strip',  # Supprimer les symboles de debug
-        '--noupx',  # Désactiver UPX (peut causer des problèmes avec les DLL)
-    ]
-    
-    # Ajouter les DLL Python explicitement
-    for dll_path, dest in python_dlls:
-        cmd.extend(['--add-binary', f'{dll_path};{dest}'])
-        
-    # Ajouter les données Demucs (y compris les modèles)
-    for data_path, dest in demucs_data:
-        cmd.extend(['--add-data', f'{data_path};{dest}'])
-    
-    # Ajouter les exclusions
-    for exclude in excludes:
-        cmd.extend(['--exclude-module', exclude])
+    # strip n'existe sous Windows qu'avec MinGW : sans lui, PyInstaller avertit pour chaque binaire
+    strip_available = shutil.which('strip') is not None
+    upx_path = shutil.which('upx')
+    # Bytecode -O (sans assert) par défaut ; -OO retire aussi les docstrings, dont
+    # certaines dépendances ont besoin : niveau 2 uniquement sur demande
+    # (RSGM_BYTECODE_OPTIMIZE=2), tant qu'un exécutable ainsi construit n'a pas été validé
+    optimize_level = 2 if os.environ.get('RSGM_BYTECODE_OPTIMIZE') == '2' else 1
+    print(f"Niveau d'optimisation du bytecode: {optimize_level}")
+    binary_options = {
+        'optimize': optimize_level,
+        'strip': strip_available,
+        'upx': upx_path is not None,
+        # Runtime C et DLL Python : la compression UPX les rend inchargeables
+        'upx_exclude': ['vcruntime140.dll', 'python3.dll', f'python{sys.version_info.major}{sys.version_info.minor}.dll'],
+    }
+    print(f"strip: {'oui' if strip_available else 'non (introuvable)'}, UPX: {upx_path or 'non (introuvable)'}")
     
-    # Ajouter les imports cachés
-    for hidden in hidden_imports:
-        cmd.extend(['--hidden-import', hidden])
+    # Les listes (potentiellement des centaines de DLL) vont dans un .spec
+    # plutôt que dans une ligne de commande limitée à 32 Ko sous Windows
+    spec_path, spec_changed = _emit_spec(excludes, hidden_imports, python_dlls, _PROJECT_DATAS + demucs_data, binary_options)
     
-    # Fichier source
-    cmd.append('../gui/gui_main.py')
+    # Entrées identiques et analyse précédente présente : garder le cache de PyInstaller
+    # (le graphe de dépendances torch/CUDA n'est alors pas reparcouru)
+    analysis_toc = Path('build') / spec_path.stem / 'Analysis-00.toc'
+    cmd = [sys.executable, '-m', 'PyInstaller', '--noconfirm']
+    if spec_changed or not analysis_toc.exists():
+        cmd.append('--clean')
+    else:
+        print("Spec inchange : build incremental (sans --clean)")
+    if upx_path:
+        cmd += ['--upx-dir', os.path.dirname(upx_path)]
+    cmd.append(str(spec_path))
     
     print(f"\nCommande de compilation:")
-    print(" ".join(cmd[:10]) + " ...")  # Afficher le début
+    print(" ".join(cmd))
     
     try:
         print("\nCompilation en cours (peut prendre plusieurs minutes)...")
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # Diffuser la sortie de PyInstaller ligne par ligne (mémoire bornée, progression visible)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        error_lines = deque(maxlen=200)  # Seules les dernières erreurs sont gardées pour le résumé
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            if 'ERROR' in line:
+                error_lines.append(line)
+        returncode = proc.wait()
+        if returncode:
+            if error_lines:
+                print("\nDernieres erreurs PyInstaller:")
+                sys.stdout.write(''.join(error_lines))
+            raise subprocess.CalledProcessError(returncode, cmd)
         print("Compilation optimisee reussie!")
         
         # Vérifier le résultat
@@ -364,9 +669,7 @@ def build_optimized_onefile():
             return False
             
     except subprocess.CalledProcessError as e:
-        print(f"Erreur de compilation:")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
+        print(f"Erreur de compilation (code {e.returncode}), voir la sortie ci-dessus")
         return False
 
 # Fonctions supprimées : build_minimal_spec, compile_with_spec, compare_sizes
@@ -384,6 +687,7 @@ def main():
     
     # Affichage du résultat
     if success:
+        copy_demucs_models('dist')
         exe_path = Path('dist/RockSmithGuitarMute.exe')
         if exe_path.exists():
             size_mb = exe_path.stat().st_size / (1024 * 1024)
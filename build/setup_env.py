@@ -4,15 +4,22 @@
 import os
 import sys
 
+
+def _ensure_utf8(stream):
+    """Reconfigure le flux en UTF-8 seulement s'il ne l'est pas déjà (évite un flush inutile)."""
+    encoding = (getattr(stream, 'encoding', None) or '').lower().replace('-', '').replace('_', '')
+    if encoding != 'utf8' and hasattr(stream, 'reconfigure'):
+        stream.reconfigure(encoding='utf-8', errors='replace')
+
+
 # Forcer l'encodage UTF-8 pour stdout/stderr
 if sys.platform.startswith('win'):
     # Configurer l'encodage par défaut pour Windows
     os.environ['PYTHONIOENCODING'] = 'utf-8'
-    
-    # Reconfigurer stdout et stderr
-    if hasattr(sys.stdout, 'reconfigure'):
-        sys.stdout.reconfigure(encoding='utf-8')
-    if hasattr(sys.stderr, 'reconfigure'):
-        sys.stderr.reconfigure(encoding='utf-8')
+
+    # Reconfigurer stdout et stderr (inutile en mode UTF-8, où ils le sont déjà)
+    if not sys.flags.utf8_mode:
+        _ensure_utf8(sys.stdout)
+        _ensure_utf8(sys.stderr)
 
 print("Environment configured for UTF-8 encoding")
@@ -6,56 +6,48 @@ Use this if the application doesn't close properly
 
 import sys
 import psutil
-import time
+
+# Keywords identifying RockSmith Guitar Mute processes (already lowercase)
+_CMD_KEYS = ('rocksmith', 'guitar_mute', 'gui_main', 'launch_gui', 'demucs', 'audio2wem')
+_NAME_KEYS = ('rocksmith', 'guitar', 'demucs')
 
 def force_kill_rocksmith_processes():
     """Force kill all RockSmith Guitar Mute related processes."""
     print("Searching for RockSmith Guitar Mute processes...")
     
-    killed_processes = []
+    terminated = []
     
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+    # Only pid/name are prefetched: the command line costs a read per process
+    # and is fetched on demand below
+    for proc in psutil.process_iter(['pid', 'name']):
         try:
-            cmdline = proc.info['cmdline']
             name = proc.info['name']
             pid = proc.info['pid']
             
-            # Check if process is related to RockSmith Guitar Mute
-            is_rocksmith_process = False
-            
-            if cmdline:
-                cmdline_str = ' '.join(str(arg) for arg in cmdline).lower()
-                if any(keyword in cmdline_str for keyword in [
-                    'rocksmith', 'guitar_mute', 'gui_main', 'launch_gui',
-                    'demucs', 'audio2wem'
-                ]):
-                    is_rocksmith_process = True
+            # Check if process is related to RockSmith Guitar Mute:
+            # process name first (cheap), then each command-line argument
+            name_lower = (name or '').lower()
+            is_rocksmith_process = any(keyword in name_lower for keyword in _NAME_KEYS)
             
-            # Also check process name
-            if any(keyword in name.lower() for keyword in [
-                'rocksmith', 'guitar', 'demucs'
-            ]):
-                is_rocksmith_process = True
+            cmdline = None
+            if not is_rocksmith_process:
+                cmdline = proc.cmdline()
+                is_rocksmith_process = any(
+                    keyword in str(arg).lower() for arg in cmdline for keyword in _CMD_KEYS
+                )
             
             if is_rocksmith_process:
+                if cmdline is None:
+                    try:
+                        cmdline = proc.cmdline()
+                    except psutil.AccessDenied:
+                        cmdline = '<access denied>'
                 print(f"Found process: PID {pid} - {name}")
                 print(f"  Command: {cmdline}")
                 
                 try:
-                    process = psutil.Process(pid)
-                    process.terminate()
-                    
-                    # Wait for graceful termination
-                    try:
-                        process.wait(timeout=5)
-                        print(f"  ✅ Terminated gracefully")
-                    except psutil.TimeoutExpired:
-                        # Force kill if necessary
-                        process.kill()
-                        print(f"  ⚡ Force killed")
-                    
-                    killed_processes.append((pid, name))
-                    
+                    proc.terminate()
+                    terminated.append(proc)
                 except psutil.NoSuchProcess:
                     print(f"  ℹ️  Process already terminated")
                 except psutil.AccessDenied:
@@ -64,7 +56,27 @@ def force_kill_rocksmith_processes():
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
     
-    return killed_processes
+    # Wait for graceful termination of all processes at once (5 s total, not per process)
+    gone, alive = psutil.wait_procs(terminated, timeout=5)
+    for process in gone:
+        print(f"  ✅ PID {process.pid} terminated gracefully")
+    
+    # Force kill the survivors in one pass
+    for process in alive:
+        try:
+            process.kill()
+            print(f"  ⚡ PID {process.pid} force killed")
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied:
+            print(f"  ❌ PID {process.pid}: access denied - cannot kill process")
+    _, remaining = psutil.wait_procs(alive, timeout=3)
+    
+    remaining_pids = {process.pid for process in remaining}
+    killed_processes = [(process.pid, process.info['name']) for process in terminated
+                        if process.pid not in remaining_pids]
+    remaining_processes = [(process.pid, process.info['name']) for process in remaining]
+    return killed_processes, remaining_processes
 
 def main():
     print("=" * 60)
@@ -76,7 +88,7 @@ def main():
     
     input("Press Enter to continue or Ctrl+C to cancel...")
     
-    killed = force_kill_rocksmith_processes()
+    killed, remaining = force_kill_rocksmith_processes()
     
     if killed:
         print(f"\n✅ Killed {len(killed)} processes:")
@@ -85,13 +97,10 @@ def main():
     else:
         print("\nℹ️  No RockSmith Guitar Mute processes found")
     
-    # Wait and check again
-    print("\nWaiting 3 seconds and checking again...")
-    time.sleep(3)
-    
-    remaining = force_kill_rocksmith_processes()
     if remaining:
         print(f"⚠️  {len(remaining)} processes still running after cleanup")
+        for pid, name in remaining:
+            print(f"  - PID {pid}: {name}")
     else:
         print("🎉 All processes successfully terminated")
     
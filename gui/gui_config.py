@@ -5,13 +5,30 @@ Configuration for RockSmith Guitar Mute GUI
 
 import json
 import os
+import threading
+import weakref
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any
 
+# Optional orjson: faster config parse/serialize, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class GUIConfig:
     """Configuration manager for the graphical interface."""
     
+    # Changes made within this delay (seconds) are written to disk once
+    SAVE_DELAY = 0.5
+    # Number of recent input/output paths remembered
+    MAX_RECENT = 10
+    # Live instances, so the application's close path can flush them (see flush_all)
+    _instances = weakref.WeakSet()
+    
     def __init__(self):
         self.config_file = Path.home() / ".rocksmith_guitar_mute" / "config.json"
         self.config_file.parent.mkdir(exist_ok=True)
@@ -29,32 +46,74 @@ class GUIConfig:
             "recent_outputs": []
         }
         self.config = self.load_config()
+        self._dirty = False
+        self._save_timer = None
+        self._save_lock = threading.Lock()
+        GUIConfig._instances.add(self)
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
+        config = self.default_config.copy()
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                data = self.config_file.read_bytes()
                 # Merge with default values for new keys
-                merged_config = self.default_config.copy()
-                merged_config.update(config)
-                return merged_config
+                config.update(orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data))
             except (json.JSONDecodeError, IOError):
                 # In case of error, use default configuration
-                pass
+                config = self.default_config.copy()
         
-        return self.default_config.copy()
+        # Recent paths are kept most-recent-first in bounded deques
+        for key in ("recent_inputs", "recent_outputs"):
+            config[key] = deque(config.get(key) or [], maxlen=self.MAX_RECENT)
+        return config
     
     def save_config(self) -> None:
         """Save configuration to file."""
+        config = {
+            **self.config,
+            "recent_inputs": list(self.config["recent_inputs"]),
+            "recent_outputs": list(self.config["recent_outputs"]),
+        }
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            self.config_file.write_bytes(data)
         except IOError:
             # Ignore save errors
             pass
     
+    def _schedule_save(self) -> None:
+        """Mark the configuration as modified and save it after SAVE_DELAY."""
+        if not self.config.get("auto_save_config", True):
+            return
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write pending changes to file, if any."""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+        self.save_config()
+    
+    @classmethod
+    def flush_all(cls) -> None:
+        """Flush every live configuration (called from the application's close path,
+        which ends with os._exit and therefore never runs atexit handlers)."""
+        for config in list(cls._instances):
+            config.flush()
+    
     def get(self, key: str, default=None):
         """Get a configuration value."""
         return self.config.get(key, default)
@@ -62,35 +121,30 @@ class GUIConfig:
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value."""
         self.config[key] = value
-        if self.config.get("auto_save_config", True):
-            self.save_config()
+        self._schedule_save()
+    
+    def _add_recent(self, key: str, path: str) -> None:
+        """Move path to the front of a recent-paths deque (the oldest entry drops off)."""
+        recent = self.config[key]
+        try:
+            recent.remove(path)
+        except ValueError:
+            pass
+        recent.appendleft(path)
+        self._schedule_save()
     
     def add_recent_input(self, path: str) -> None:
         """Add an input path to recent ones."""
-        recent = self.config.get("recent_inputs", [])
-        if path in recent:
-            recent.remove(path)
-        recent.insert(0, path)
-        # Keep only the last 10
-        self.config["recent_inputs"] = recent[:10]
-        if self.config.get("auto_save_config", True):
-            self.save_config()
+        self._add_recent("recent_inputs", path)
     
     def add_recent_output(self, path: str) -> None:
         """Add an output path to recent ones."""
-        recent = self.config.get("recent_outputs", [])
-        if path in recent:
-            recent.remove(path)
-        recent.insert(0, path)
-        # Keep only the last 10
-        self.config["recent_outputs"] = recent[:10]
-        if self.config.get("auto_save_config", True):
-            self.save_config()
+        self._add_recent("recent_outputs", path)
     
     def get_recent_inputs(self) -> list:
         """Get the list of recent input paths."""
-        return self.config.get("recent_inputs", [])
+        return list(self.config["recent_inputs"])
     
     def get_recent_outputs(self) -> list:
         """Get the list of recent output paths."""
-        return self.config.get("recent_outputs", [])
+        return list(self.config["recent_outputs"])
@@ -12,10 +12,13 @@ import sys
 from pathlib import Path
 from typing import Optional, List
 import logging
+import logging.handlers
 import subprocess
 import signal
 import atexit
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Import conditionnel de Pillow (PIL)
 try:
@@ -27,7 +30,6 @@ except ImportError:
 
 # Configure Windows to run all subprocess calls silently
 if sys.platform == "win32":
-    import subprocess
     # Ensure all subprocess calls are silent by default
     os.environ["PYTHONIOENCODING"] = "utf-8"
     
@@ -49,33 +51,81 @@ if sys.platform == "win32":
         pass  # Ignore if unable to hide console
 
 # Import main module
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from rocksmith_guitar_mute import RocksmithGuitarMute, setup_logging
+_project_root = str(Path(__file__).parent.parent)
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+from rocksmith_guitar_mute import (
+    RocksmithGuitarMute, setup_logging, init_psarc_worker, process_single_psarc_worker,
+    patch_subprocess_for_silence, pool_thread_count, resolve_device
+)
 
+# Maximum number of lines kept in the activity log (older lines are dropped)
+MAX_LOG_LINES = 2000
 
-def patch_subprocess_for_silence():
-    """Patch subprocess module to ensure all calls are silent on Windows."""
-    if sys.platform == "win32":
-        import subprocess
-        original_run = subprocess.run
-        original_popen = subprocess.Popen
-        
-        def silent_run(*args, **kwargs):
-            if 'creationflags' not in kwargs:
-                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-            if 'capture_output' not in kwargs and 'stdout' not in kwargs:
-                kwargs['capture_output'] = True
-            return original_run(*args, **kwargs)
-        
-        def silent_popen(*args, **kwargs):
-            if 'creationflags' not in kwargs:
-                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-            return original_popen(*args, **kwargs)
-        
-        subprocess.run = silent_run
-        subprocess.Popen = silent_popen
+# Message queue polling interval (ms): fast while messages arrive, then backing
+# off by QUEUE_POLL_BUSY_MS per empty tick up to QUEUE_POLL_IDLE_MS
+QUEUE_POLL_BUSY_MS = 30
+QUEUE_POLL_IDLE_MS = 250
+
+# Choices offered in the options panel
+DEMUCS_MODELS = ("htdemucs_6s", "htdemucs", "htdemucs_ft", "mdx_extra", "mdx")
+DEVICES = ("auto", "cpu", "cuda")
+CPU_COUNT = os.cpu_count() or 1
+# Default parallel processes: each one holds its own Demucs model, so stay small
+DEFAULT_WORKERS = min(4, CPU_COUNT)
+
+# Upper bound on pending GUI messages; when full, worker messages wait and
+# low-level log lines are dropped
+MESSAGE_QUEUE_SIZE = 4096
+
+
+def _list_psarc_files(directory: Path) -> List[Path]:
+    """List the PSARC files of a directory in a single os.scandir pass."""
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.name.lower().endswith('.psarc') and entry.is_file()]
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process queue: records are enqueued as-is and
+    formatted later on the QueueListener thread, not on the logging thread."""
+    
+    def prepare(self, record):
+        return record
+
+
+class _GUIRelayHandler(logging.Handler):
+    """Forward log records to the GUI message queue (runs on the QueueListener thread).
+    
+    Lines are built directly as "<seconds since start> <level initial> <message>",
+    skipping the Formatter (and its strftime) for everything but tracebacks.
+    When the GUI queue is full, DEBUG/INFO lines are dropped (and counted) while
+    warnings and errors wait up to PUT_TIMEOUT seconds for room before being
+    dropped too, so the listener can never block on the Tk thread indefinitely.
+    """
+    
+    PUT_TIMEOUT = 0.5
+    
+    def __init__(self, message_queue):
+        super().__init__()
+        self.message_queue = message_queue
+        self.dropped = 0  # Only written by the listener thread
+    
+    def emit(self, record):
+        if record.exc_info:
+            message = self.format(record)
+        else:
+            message = f"{record.relativeCreated / 1000:8.2f}s {record.levelname[0]} {record.getMessage()}"
+        try:
+            self.message_queue.put_nowait(('log', message))
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                try:
+                    self.message_queue.put(('log', message), timeout=self.PUT_TIMEOUT)
+                    return
+                except queue.Full:
+                    pass
+            self.dropped += 1
 
 
 class SplashScreen:
@@ -244,20 +294,54 @@ class RocksmithGuitarMuteGUI:
             self.overwrite_var = tk.BooleanVar(value=False)
             self.model_var = tk.StringVar(value="htdemucs_6s")
             self.device_var = tk.StringVar(value="auto")
-            self.workers_var = tk.IntVar(value=os.cpu_count())
+            self.workers_var = tk.IntVar(value=DEFAULT_WORKERS)
+            self.verbose_var = tk.BooleanVar(value=False)
             
             # Processing state
             self.processing = False
             self.paused = False
             self.cancelled = False
+            # Set while running; cleared on pause so the worker blocks instead of polling
+            self._resume_event = threading.Event()
+            self._resume_event.set()
+            # Set while files are handed to a process pool (pause cannot hold them back)
+            self._pool_active = False
+            # Latest status/progress waiting to be applied by an idle callback
+            self._pending_status = None
+            self._pending_progress = None
+            self._apply_scheduled = False
+            # Overwrite confirmation handshake between the worker and the Tk thread
+            self._confirm_event = threading.Event()
+            self._confirm_result = False
+            # Activity log line cap (per instance, defaults to MAX_LOG_LINES)
+            self.max_log_lines = MAX_LOG_LINES
+            # Dropped log lines already reported in the activity log
+            self._reported_dropped = 0
+            # Consecutive check_queue ticks that found no message
+            self._idle_ticks = 0
             self.processor = None
-            self.processing_thread = None
+            # Processors reused across runs, keyed by (model, device)
+            self._processor_cache = {}
+            # Verbosity the core logging was last configured with (None = not yet)
+            self._logging_verbose = None
+            self.model_var.trace_add('write', self._invalidate_processor_cache)
+            self.device_var.trace_add('write', self._invalidate_processor_cache)
             
             # Flag to track clean shutdown
             self.shutdown_requested = False
             
-            # Queue for inter-thread communication
-            self.message_queue = queue.Queue()
+            # Queue for inter-thread communication (progress travels separately,
+            # only its latest value is kept)
+            self.message_queue = queue.Queue(maxsize=MESSAGE_QUEUE_SIZE)
+            self._progress_lock = threading.Lock()
+            self._latest_progress = None
+            
+            # Long-lived worker thread: one job per Start click, None stops it
+            self._job_q = queue.SimpleQueue()
+            self.processing_thread = threading.Thread(
+                target=self._worker_loop, name="ProcessingWorker", daemon=True
+            )
+            self.processing_thread.start()
             print("✅ Variables initialized")
             
             self.splash.update_progress(60, "Configuring log system...")
@@ -303,6 +387,8 @@ class RocksmithGuitarMuteGUI:
             print("🔧 Displaying main window...")
             self.root.deiconify()
             self.splash.destroy()
+            # Build the option widgets (ttk theming is slow) once the window is mapped
+            self.root.after_idle(self._build_options)
             print("✅ GUI interface completely initialized - window visible")
             
         except Exception as e:
@@ -481,27 +567,30 @@ class RocksmithGuitarMuteGUI:
             self.logger.debug(f"Error applying dark theme: {e}")
     
     def setup_gui_logging(self):
-        """Configure logging for the graphical interface."""
-        # Logger for the interface
-        self.logger = logging.getLogger("GUI")
-        self.logger.setLevel(logging.INFO)
-        
-        # Custom handler to send logs to the GUI
-        class GUILogHandler(logging.Handler):
-            def __init__(self, message_queue):
-                super().__init__()
-                self.message_queue = message_queue
-            
-            def emit(self, record):
-                msg = self.format(record)
-                self.message_queue.put(('log', msg))
+        """Configure logging for the graphical interface (idempotent)."""
+        if getattr(self, '_log_listener', None) is not None:
+            return
         
-        gui_handler = GUILogHandler(self.message_queue)
-        gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        # Handler that sends formatted logs to the GUI, run by a listener thread
+        self._gui_log_handler = _GUIRelayHandler(self.message_queue)
+        self._gui_log_handler.setLevel(logging.INFO)
+        self._gui_log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        
+        self._log_queue = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(
+            self._log_queue, self._gui_log_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
         
-        # Add handler to main logger
+        # The main logger only enqueues records (no formatting on the worker thread)
+        self._log_queue_handler = _InProcessQueueHandler(self._log_queue)
         root_logger = logging.getLogger()
-        root_logger.addHandler(gui_handler)
+        root_logger.addHandler(self._log_queue_handler)
+    
+    def stop_gui_logging(self):
+        """Detach the GUI log handler and stop its listener thread."""
+        logging.getLogger().removeHandler(self._log_queue_handler)
+        self._log_listener.stop()
     
     def create_widgets(self):
         """Create all interface widgets."""
@@ -608,56 +697,8 @@ class RocksmithGuitarMuteGUI:
         options_content = tk.Frame(options_frame, bg='#2d2d2d')
         options_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
         
-        # Checkbox
-        self.overwrite_check = tk.Checkbutton(
-            options_content, 
-            text="Allow overwriting existing files",
-            variable=self.overwrite_var,
-            bg='#2d2d2d', fg='#ffffff', selectcolor='#404040',
-            font=("Segoe UI", 10), activebackground='#2d2d2d', activeforeground='#ffffff'
-        )
-        self.overwrite_check.grid(row=0, column=0, columnspan=4, sticky=tk.W, pady=(0, 15))
-        
-        # Options en ligne
-        tk.Label(options_content, text="Demucs Model:", 
-                font=("Segoe UI", 10), fg='#ffffff', bg='#2d2d2d').grid(row=1, column=0, sticky=tk.W, padx=(0, 10))
-        
-        self.model_combo = ttk.Combobox(
-            options_content, 
-            textvariable=self.model_var,
-            values=["htdemucs_6s", "htdemucs", "htdemucs_ft", "mdx_extra", "mdx"],
-            state="readonly",
-            width=15,
-            font=("Segoe UI", 9)
-        )
-        self.model_combo.grid(row=1, column=1, sticky=tk.W, padx=(0, 20))
-        
-        tk.Label(options_content, text="Device:", 
-                font=("Segoe UI", 10), fg='#ffffff', bg='#2d2d2d').grid(row=1, column=2, sticky=tk.W, padx=(0, 10))
-        
-        self.device_combo = ttk.Combobox(
-            options_content,
-            textvariable=self.device_var,
-            values=["auto", "cpu", "cuda"],
-            state="readonly",
-            width=15,
-            font=("Segoe UI", 9)
-        )
-        self.device_combo.grid(row=1, column=3, sticky=tk.W)
-        
-        tk.Label(options_content, text="Number of processes:", 
-                font=("Segoe UI", 10), fg='#ffffff', bg='#2d2d2d').grid(row=2, column=0, sticky=tk.W, pady=(10, 0), padx=(0, 10))
-        
-        self.workers_spin = tk.Spinbox(
-            options_content,
-            from_=1,
-            to=os.cpu_count() * 2,
-            textvariable=self.workers_var,
-            width=15,
-            bg='#404040', fg='#ffffff', insertbackground='#ffffff',
-            relief='solid', bd=1, font=("Segoe UI", 9)
-        )
-        self.workers_spin.grid(row=2, column=1, sticky=tk.W, pady=(10, 0))
+        # Option widgets are built once the window is shown (see _build_options)
+        self._options_content = options_content
         
         # === Progress Section ===
         progress_frame = self.create_section_frame(main_frame, "📊 Progress")
@@ -666,11 +707,12 @@ class RocksmithGuitarMuteGUI:
         progress_content = tk.Frame(progress_frame, bg='#2d2d2d')
         progress_content.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
         
-        # Progress bar
-        self.progress_var = tk.DoubleVar()
+        # Progress bar and status label are updated directly (no Tk variable traces),
+        # and only when the shown value changes
+        self._last_progress = 0.0
         self.progress_bar = ttk.Progressbar(
             progress_content,
-            variable=self.progress_var,
+            value=self._last_progress,
             maximum=100,
             mode='determinate',
             style='TProgressbar'
@@ -678,8 +720,8 @@ class RocksmithGuitarMuteGUI:
         self.progress_bar.pack(fill=tk.X, pady=(0, 10))
         
         # Status label
-        self.status_var = tk.StringVar(value="Ready")
-        self.status_label = tk.Label(progress_content, textvariable=self.status_var, 
+        self._last_status = "Ready"
+        self.status_label = tk.Label(progress_content, text=self._last_status, 
                                    font=("Segoe UI", 10), fg='#ffffff', bg='#2d2d2d')
         self.status_label.pack(anchor=tk.W)
         
@@ -725,7 +767,7 @@ class RocksmithGuitarMuteGUI:
             log_text_frame,
             height=8,
             wrap=tk.WORD,
-            state=tk.DISABLED,
+            undo=False,
             bg='#1a1a1a',
             fg='#ffffff',
             insertbackground='#ffffff',
@@ -736,6 +778,12 @@ class RocksmithGuitarMuteGUI:
             bd=1
         )
         
+        # Read-only without toggling the state on every insert: swallow editing
+        # keys and clipboard edits, keep selection and copy working
+        self.log_text.bind('<Key>', self._block_log_edit)
+        for sequence in ('<<Paste>>', '<<PasteSelection>>', '<<Cut>>', '<<Clear>>'):
+            self.log_text.bind(sequence, lambda event: "break")
+        
         log_scrollbar = tk.Scrollbar(log_text_frame, orient=tk.VERTICAL, command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=log_scrollbar.set)
         
@@ -749,6 +797,70 @@ class RocksmithGuitarMuteGUI:
         clear_btn = self.create_button(log_controls, "🗑️ Clear Logs", self.clear_logs)
         clear_btn.pack(side=tk.RIGHT)
     
+    def _build_options(self):
+        """Populate the processing options panel (deferred until the main window is shown)."""
+        options_content = self._options_content
+        
+        # Checkbox
+        self.overwrite_check = tk.Checkbutton(
+            options_content, 
+            text="Allow overwriting existing files",
+            variable=self.overwrite_var,
+            bg='#2d2d2d', fg='#ffffff', selectcolor='#404040',
+            font=("Segoe UI", 10), activebackground='#2d2d2d', activeforeground='#ffffff'
+        )
+        self.overwrite_check.grid(row=0, column=0, columnspan=4, sticky=tk.W, pady=(0, 15))
+        
+        # Options en ligne
+        tk.Label(options_content, text="Demucs Model:", 
+                font=("Segoe UI", 10), fg='#ffffff', bg='#2d2d2d').grid(row=1, column=0, sticky=tk.W, padx=(0, 10))
+        
+        self.model_combo = ttk.Combobox(
+            options_content, 
+            textvariable=self.model_var,
+            values=DEMUCS_MODELS,
+            state="readonly",
+            width=15,
+            font=("Segoe UI", 9)
+        )
+        self.model_combo.grid(row=1, column=1, sticky=tk.W, padx=(0, 20))
+        
+        tk.Label(options_content, text="Device:", 
+                font=("Segoe UI", 10), fg='#ffffff', bg='#2d2d2d').grid(row=1, column=2, sticky=tk.W, padx=(0, 10))
+        
+        self.device_combo = ttk.Combobox(
+            options_content,
+            textvariable=self.device_var,
+            values=DEVICES,
+            state="readonly",
+            width=15,
+            font=("Segoe UI", 9)
+        )
+        self.device_combo.grid(row=1, column=3, sticky=tk.W)
+        
+        tk.Label(options_content, text="Number of processes:", 
+                font=("Segoe UI", 10), fg='#ffffff', bg='#2d2d2d').grid(row=2, column=0, sticky=tk.W, pady=(10, 0), padx=(0, 10))
+        
+        self.workers_spin = tk.Spinbox(
+            options_content,
+            from_=1,
+            to=CPU_COUNT * 2,
+            textvariable=self.workers_var,
+            width=15,
+            bg='#404040', fg='#ffffff', insertbackground='#ffffff',
+            relief='solid', bd=1, font=("Segoe UI", 9)
+        )
+        self.workers_spin.grid(row=2, column=1, sticky=tk.W, pady=(10, 0))
+        
+        self.verbose_check = tk.Checkbutton(
+            options_content,
+            text="Verbose logging (debug)",
+            variable=self.verbose_var,
+            bg='#2d2d2d', fg='#ffffff', selectcolor='#404040',
+            font=("Segoe UI", 10), activebackground='#2d2d2d', activeforeground='#ffffff'
+        )
+        self.verbose_check.grid(row=2, column=2, columnspan=2, sticky=tk.W, pady=(10, 0))
+    
     def create_section_frame(self, parent, title):
         """Créer un frame de section avec titre."""
         section_frame = tk.Frame(parent, bg='#1e1e1e')
@@ -831,7 +943,7 @@ class RocksmithGuitarMuteGUI:
             self.output_path.set(folder)
     
     def validate_inputs(self) -> bool:
-        """Validate user inputs."""
+        """Validate user inputs (no filesystem access; paths are checked when listed)."""
         if not self.input_path.get():
             messagebox.showerror("Error", "Please select an input file or folder.")
             return False
@@ -840,11 +952,6 @@ class RocksmithGuitarMuteGUI:
             messagebox.showerror("Error", "Please select an output folder.")
             return False
         
-        input_path = Path(self.input_path.get())
-        if not input_path.exists():
-            messagebox.showerror("Erreur", f"Le chemin d'entrée n'existe pas: {input_path}")
-            return False
-        
         return True
     
     def start_processing(self):
@@ -852,165 +959,238 @@ class RocksmithGuitarMuteGUI:
         if not self.validate_inputs():
             return
         
-        # Check existing files if necessary
-        if not self.overwrite_var.get():
-            input_path = Path(self.input_path.get())
-            output_path = Path(self.output_path.get())
-            
-            if input_path.is_file():
-                output_file = output_path / input_path.name
-                if output_file.exists():
-                    result = messagebox.askyesno(
-                        "Existing File",
-                        f"The file {output_file.name} already exists. Do you want to replace it?"
-                    )
-                    if not result:
-                        return
-            else:
-                # Check if there are files that would be overwritten
-                psarc_files = list(input_path.glob("*.psarc"))
-                existing_files = [f for f in psarc_files if (output_path / f.name).exists()]
-                
-                if existing_files:
-                    result = messagebox.askyesno(
-                        "Existing Files",
-                        f"{len(existing_files)} file(s) already exist in the output folder. "
-                        "Do you want to replace them?"
-                    )
-                    if not result:
-                        return
-        
         # Update interface
         self.processing = True
         self.paused = False
         self.cancelled = False
+        self._resume_event.set()
         
         self.start_button.config(state=tk.DISABLED)
         self.pause_button.config(state=tk.NORMAL)
         self.cancel_button.config(state=tk.NORMAL)
         
-        self.status_var.set("Initialisation...")
-        self.progress_var.set(0)
+        self._set_status("Initialisation...")
+        self._set_progress(0)
         
-        # Start processing thread
-        self.processing_thread = threading.Thread(target=self.process_files, daemon=False)  # Not daemon
-        self.processing_thread.start()
+        # Hand the job to the worker thread; listing the files and the overwrite
+        # check run there, off the Tk thread
+        self._job_q.put({
+            'input': Path(self.input_path.get()),
+            'output': Path(self.output_path.get()),
+            'force': self.overwrite_var.get(),
+        })
     
     def pause_processing(self):
         """Pause or resume processing."""
         if self.paused:
             self.paused = False
+            self._resume_event.set()
             self.pause_button.config(text="⏸️ Pause")
-            self.status_var.set("Reprise du traitement...")
-            self.message_queue.put(('log', "Traitement repris"))
+            self._set_status("Reprise du traitement...")
+            self.add_log_message("Traitement repris")  # Tk thread: never block on its own queue
         else:
             self.paused = True
+            self._resume_event.clear()
             self.pause_button.config(text="▶️ Reprendre")
-            self.status_var.set("Traitement en pause...")
-            self.message_queue.put(('log', "Traitement mis en pause"))
+            self.add_log_message("Traitement mis en pause")  # Tk thread: never block on its own queue
+            if self._pool_active:
+                # Files already queued to the worker processes keep being processed
+                self._set_status("En pause (les fichiers déjà envoyés aux processus continuent)...")
+                self.add_log_message("Pause : les fichiers déjà envoyés aux processus parallèles "
+                                     "continuent d'être traités ; leurs résultats seront affichés à la reprise")
+            else:
+                self._set_status("Traitement en pause...")
     
     def cancel_processing(self):
         """Cancel current processing."""
         result = messagebox.askyesno("Confirmation", "Are you sure you want to cancel the processing?")
         if result:
             self.cancelled = True
-            self.status_var.set("Annulation...")
-            self.message_queue.put(('log', "Annulation demandée par l'utilisateur"))
+            self._resume_event.set()  # Unblock a paused worker so it sees the cancellation
+            self._set_status("Annulation...")
+            self.add_log_message("Annulation demandée par l'utilisateur")  # Tk thread: never block on its own queue
+    
+    def _set_log_verbosity(self, verbose: bool):
+        """Set the console and GUI log levels (the log file always records DEBUG)."""
+        level = logging.DEBUG if verbose else logging.INFO
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
+                handler.setLevel(level)
+        self._gui_log_handler.setLevel(level)
+        self._logging_verbose = verbose
+    
+    def _worker_loop(self):
+        """Run processing jobs from the job queue until a None sentinel arrives."""
+        while True:
+            job = self._job_q.get()
+            if job is None:
+                return
+            self.process_files(job['input'], job['output'], job['force'])
     
-    def process_files(self):
-        """Process files in the background."""
+    def _stop_worker(self, timeout: float):
+        """Ask the worker thread to exit after its current job and wait for it."""
+        self._job_q.put(None)
+        if self.processing_thread.is_alive():
+            self.processing_thread.join(timeout=timeout)
+        return not self.processing_thread.is_alive()
+    
+    def _list_input_files(self, input_path: Path) -> Optional[List[Path]]:
+        """List the PSARC files to process, or post an error and return None if the input is missing."""
         try:
-            # Logging configuration for this thread
-            setup_logging(verbose=True)
+            if input_path.is_file():
+                return [input_path] if input_path.suffix.lower() == '.psarc' else []
+            return _list_psarc_files(input_path)
+        except OSError:
+            self.message_queue.put(('error', f"Le chemin d'entrée n'existe pas: {input_path}"))
+            return None
+    
+    def _confirm_overwrite(self, existing_count: int) -> bool:
+        """Ask the user (on the Tk thread) whether existing outputs may be replaced; blocks the worker."""
+        self._confirm_event.clear()
+        self.message_queue.put(('confirm_overwrite', existing_count))
+        self._confirm_event.wait()
+        return self._confirm_result and not (self.cancelled or self.shutdown_requested)
+    
+    def _ask_overwrite(self, existing_count: int):
+        """Show the overwrite confirmation and hand the answer back to the worker."""
+        if existing_count == 1:
+            message = "1 file already exists in the output folder. Do you want to replace it?"
+        else:
+            message = (f"{existing_count} file(s) already exist in the output folder. "
+                       "Do you want to replace them?")
+        self._confirm_result = messagebox.askyesno("Existing Files", message)
+        self._confirm_event.set()
+    
+    def process_files(self, input_path: Path, output_path: Path, force: bool):
+        """Process files in the background (runs on the worker thread)."""
+        try:
+            # Configure the core logging once per session (setup_logging replaces the
+            # root handlers, truncates the log file and runs the diagnostics);
+            # later verbosity changes only adjust handler levels
+            verbose = self.verbose_var.get()
+            if self._logging_verbose is None:
+                setup_logging(verbose=verbose)
+                logging.getLogger().addHandler(self._log_queue_handler)
+            if verbose != self._logging_verbose:
+                self._set_log_verbosity(verbose)
             
             # Check if shutdown was requested before starting
             if self.shutdown_requested or self.cancelled:
                 self.message_queue.put(('log', "Processing cancelled before start"))
                 return
             
-            # Processor initialization
-            self.message_queue.put(('log', f"Initializing with model {self.model_var.get()}"))
-            self.message_queue.put(('status', "Initializing processor..."))
-            
-            processor = RocksmithGuitarMute(
-                demucs_model=self.model_var.get(),
-                device=self.device_var.get()
-            )
-            
-            # Check cancellation again
-            if self.shutdown_requested or self.cancelled:
-                self.message_queue.put(('log', "Processing cancelled during initialization"))
+            files_to_process = self._list_input_files(input_path)
+            if files_to_process is None:
+                self.cancelled = True
                 return
             
-            input_path = Path(self.input_path.get())
-            output_path = Path(self.output_path.get())
-            
-            # Determine files to process
-            if input_path.is_file():
-                files_to_process = [input_path] if input_path.suffix.lower() == '.psarc' else []
-            else:
-                files_to_process = list(input_path.glob("*.psarc"))
-            
             if not files_to_process:
                 self.message_queue.put(('log', "No PSARC files found"))
                 self.message_queue.put(('status', "No files to process"))
                 return
             
+            # Existing outputs: one directory read, then ask before replacing them
+            if not force:
+                try:
+                    with os.scandir(output_path) as entries:
+                        existing_names = {entry.name for entry in entries}
+                except FileNotFoundError:
+                    existing_names = set()
+                existing_count = sum(1 for f in files_to_process if f.name in existing_names)
+                if existing_count:
+                    if not self._confirm_overwrite(existing_count):
+                        self.cancelled = True
+                        self.message_queue.put(('log', "Processing cancelled: existing files kept"))
+                        self.message_queue.put(('status', "Cancelled"))
+                        return
+                    force = True
+            
+            demucs_model = self.model_var.get()
+            # Resolved without building a processor: pool runs never need one here
+            device = resolve_device(self.device_var.get())
             total_files = len(files_to_process)
-            self.message_queue.put(('log', f"Processing {total_files} file(s)"))
             
             processed_count = 0
+            try:
+                workers = int(self.workers_var.get())
+            except (tk.TclError, ValueError):
+                workers = 1
             
-            for i, psarc_file in enumerate(files_to_process):
-                # Check for cancellation at the start of each file
-                if self.cancelled or self.shutdown_requested:
-                    self.message_queue.put(('log', "Processing cancelled"))
-                    break
-                
-                # Pause handling
-                while self.paused and not self.cancelled and not self.shutdown_requested:
-                    threading.Event().wait(0.1)
+            self.message_queue.put(('log', f"Initializing with model {demucs_model}"))
+            self.message_queue.put(('log', f"Processing {total_files} file(s)"))
+            
+            if device == 'cpu' and workers > 1 and total_files > 1:
+                # CPU-bound work: one worker process per file, up to the requested count;
+                # each worker loads its own processor (GPU runs stay sequential so they
+                # do not compete for VRAM)
+                processed_count = self._process_files_in_pool(files_to_process, output_path, force, workers)
+            else:
+                self.message_queue.put(('status', "Initializing processor..."))
                 
-                # Check again after pause
-                if self.cancelled or self.shutdown_requested:
-                    break
+                processor_key = (demucs_model, device)
+                processor = self._processor_cache.get(processor_key)
+                if processor is None:
+                    processor = RocksmithGuitarMute(
+                        demucs_model=demucs_model,
+                        device=device
+                    )
+                    self._processor_cache[processor_key] = processor
                 
-                # Status update
-                self.message_queue.put(('status', f"Processing {psarc_file.name} ({i+1}/{total_files})"))
-                self.message_queue.put(('progress', (i / total_files) * 100))
+                # Check cancellation again
+                if self.shutdown_requested or self.cancelled:
+                    self.message_queue.put(('log', "Processing cancelled during initialization"))
+                    return
                 
-                try:
-                    # File processing
-                    result = processor.process_psarc_file(
-                        psarc_file,
-                        output_path,
-                        force=self.overwrite_var.get()
-                    )
-                    
-                    # Check for cancellation after processing
+                for i, psarc_file in enumerate(files_to_process):
+                    # Check for cancellation at the start of each file
                     if self.cancelled or self.shutdown_requested:
+                        self.message_queue.put(('log', "Processing cancelled"))
                         break
                     
-                    if result:
-                        processed_count += 1
-                        self.message_queue.put(('log', f"✓ File processed successfully: {result.name}"))
-                    else:
-                        self.message_queue.put(('log', f"⚠ File skipped: {psarc_file.name}"))
-
-                except Exception as e:
-                    self.message_queue.put(('log', f"✗ Error processing {psarc_file.name}: {e}"))
-                    # Check for cancellation after error
+                    # Pause handling: block until resumed (cancel/shutdown also set the event)
+                    if not self._resume_event.is_set():
+                        self._resume_event.wait()
+                    
+                    # Check again after pause
                     if self.cancelled or self.shutdown_requested:
                         break
-                
-                # Progress update
-                self.message_queue.put(('progress', ((i + 1) / total_files) * 100))
+                    
+                    # Status update
+                    self.message_queue.put(('status', f"Processing {psarc_file.name} ({i+1}/{total_files})"))
+                    self._post_progress((i / total_files) * 100)
+                    
+                    try:
+                        # File processing
+                        result = processor.process_psarc_file(
+                            psarc_file,
+                            output_path,
+                            force=force
+                        )
+                        
+                        # Check for cancellation after processing
+                        if self.cancelled or self.shutdown_requested:
+                            break
+                        
+                        if result:
+                            processed_count += 1
+                            self.message_queue.put(('log', f"✓ File processed successfully: {result.name}"))
+                        else:
+                            self.message_queue.put(('log', f"⚠ File skipped: {psarc_file.name}"))
+
+                    except Exception as e:
+                        self.message_queue.put(('log', f"✗ Error processing {psarc_file.name}: {e}"))
+                        # Check for cancellation after error
+                        if self.cancelled or self.shutdown_requested:
+                            break
+                    
+                    # Progress update
+                    self._post_progress(((i + 1) / total_files) * 100)
             
             # Processing completed
             if not self.cancelled and not self.shutdown_requested:
                 self.message_queue.put(('status', f"Processing completed - {processed_count}/{total_files} files processed"))
                 self.message_queue.put(('log', f"Processing completed successfully! {processed_count} file(s) processed"))
-                self.message_queue.put(('progress', 100))
+                self._post_progress(100)
             
         except Exception as e:
             if not self.shutdown_requested:
@@ -1024,17 +1204,10 @@ class RocksmithGuitarMuteGUI:
                 if 'processor' in locals():
                     del processor
                     
-                # Force garbage collection
+                # Force garbage collection (the CUDA caching allocator is kept warm
+                # for the next run; it is only purged on exit)
                 import gc
                 gc.collect()
-                
-                # Clear PyTorch cache if available
-                try:
-                    import torch
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                except:
-                    pass
                     
             except Exception as e:
                 if not self.shutdown_requested:
@@ -1044,51 +1217,206 @@ class RocksmithGuitarMuteGUI:
             if not self.shutdown_requested:
                 self.message_queue.put(('processing_done', None))
     
+    def _invalidate_processor_cache(self, *args):
+        """Drop cached processors when the model or device selection changes."""
+        self._processor_cache.clear()
+    
+    def _process_files_in_pool(self, files_to_process: List[Path], output_path: Path,
+                               force: bool, workers: int) -> int:
+        """Process PSARC files in parallel worker processes (CPU only). Returns the number processed."""
+        total_files = len(files_to_process)
+        demucs_model = self.model_var.get()
+        max_workers = min(workers, total_files)
+        self.message_queue.put(('log', f"Using {max_workers} parallel worker processes"))
+        self.message_queue.put(('status', f"Processing {total_files} files in parallel..."))
+        self._post_progress(0)
+        
+        processed_count = 0
+        future_to_file = {}
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=init_psarc_worker,
+            initargs=(demucs_model, 'cpu', pool_thread_count(max_workers)),
+        )
+        self._pool_active = True
+        try:
+            future_to_file = {
+                executor.submit(process_single_psarc_worker,
+                                (psarc_file, output_path, demucs_model, 'cpu', force)): psarc_file
+                for psarc_file in files_to_process
+            }
+            
+            for done_count, future in enumerate(as_completed(future_to_file), start=1):
+                # Pause handling: the pool keeps processing queued files; results are collected once resumed
+                if not self._resume_event.is_set():
+                    self._resume_event.wait()
+                if self.cancelled or self.shutdown_requested:
+                    self.message_queue.put(('log', "Cancelling: waiting for the files in progress to finish..."))
+                    break
+                
+                psarc_file = future_to_file[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.message_queue.put(('log', f"✗ Error processing {psarc_file.name}: {e}"))
+                else:
+                    if result:
+                        processed_count += 1
+                        self.message_queue.put(('log', f"✓ File processed successfully: {result.name}"))
+                    else:
+                        self.message_queue.put(('log', f"⚠ File skipped: {psarc_file.name}"))
+                
+                self.message_queue.put(('status', f"Processed {done_count}/{total_files} files"))
+                self._post_progress((done_count / total_files) * 100)
+        finally:
+            # On cancellation, drop queued files but let running ones finish, so no
+            # worker is still writing output once "cancelled" is reported
+            # (futures cancelled by hand: shutdown(cancel_futures=) needs Python 3.9)
+            self._pool_active = False
+            cancelled = self.cancelled or self.shutdown_requested
+            if cancelled:
+                for future in future_to_file:
+                    future.cancel()
+            executor.shutdown(wait=True)
+        
+        if cancelled:
+            self.message_queue.put(('log', "Processing cancelled"))
+        return processed_count
+    
+    def _post_progress(self, value: float):
+        """Record the latest progress value for the GUI (older values are dropped)."""
+        with self._progress_lock:
+            self._latest_progress = value
+    
     def check_queue(self):
         """Check message queue and update interface."""
+        # Drain everything first, keeping only the latest status/progress:
+        # each Tk variable is then written at most once per tick
+        log_lines = []
+        latest_status = None
+        processing_done = False
+        errors = []
+        drained = 0
         try:
             while True:
                 msg_type, msg_data = self.message_queue.get_nowait()
+                drained += 1
                 
                 if msg_type == 'log':
-                    self.add_log_message(msg_data)
+                    log_lines.append(msg_data)
                 elif msg_type == 'status':
-                    self.status_var.set(msg_data)
-                elif msg_type == 'progress':
-                    self.progress_var.set(msg_data)
+                    latest_status = msg_data
                 elif msg_type == 'processing_done':
-                    self.processing_finished()
+                    processing_done = True
+                elif msg_type == 'error':
+                    errors.append(msg_data)
+                elif msg_type == 'confirm_overwrite':
+                    # Dialog shown outside this tick; the worker waits for the answer
+                    self.root.after_idle(self._ask_overwrite, msg_data)
                 
         except queue.Empty:
             pass
         
-        # Schedule next check
-        self.root.after(100, self.check_queue)
+        with self._progress_lock:
+            latest_progress = self._latest_progress
+            self._latest_progress = None
+        if latest_progress is not None:
+            drained += 1  # A progress change counts as activity for the polling rate
+        
+        dropped = self._gui_log_handler.dropped
+        if dropped != self._reported_dropped:
+            log_lines.append(f"⚠ {dropped - self._reported_dropped} log line(s) dropped (log output faster than display)")
+            self._reported_dropped = dropped
+        
+        if log_lines:
+            self.add_log_messages(log_lines)
+        if latest_status is not None:
+            self._pending_status = latest_status
+        if latest_progress is not None:
+            self._pending_progress = latest_progress
+        for error in errors:
+            messagebox.showerror("Erreur", error)
+        if processing_done:
+            # Show the final values before the completion dialog
+            self._apply_pending()
+            self.processing_finished()
+        elif (latest_status is not None or latest_progress is not None) and not self._apply_scheduled:
+            self._apply_scheduled = True
+            self.root.after_idle(self._apply_pending)
+        
+        # Schedule next check, backing off gradually while the queue stays empty
+        if drained:
+            self._idle_ticks = 0
+            delay = QUEUE_POLL_BUSY_MS
+        else:
+            self._idle_ticks += 1
+            delay = min(QUEUE_POLL_IDLE_MS, QUEUE_POLL_BUSY_MS * (self._idle_ticks + 1))
+        self.root.after(delay, self.check_queue)
+    
+    def _apply_pending(self):
+        """Apply the latest pending status/progress values in one pass."""
+        self._apply_scheduled = False
+        if self._pending_status is not None:
+            self._set_status(self._pending_status)
+            self._pending_status = None
+        if self._pending_progress is not None:
+            self._set_progress(self._pending_progress)
+            self._pending_progress = None
+    
+    def _set_status(self, text: str):
+        """Show a status message (skips the Tk call when unchanged)."""
+        if text != self._last_status:
+            self.status_label.configure(text=text)
+            self._last_status = text
+    
+    def _set_progress(self, value: float):
+        """Move the progress bar (skips the Tk call when unchanged)."""
+        if value != self._last_progress:
+            self.progress_bar['value'] = value
+            self._last_progress = value
     
     def add_log_message(self, message: str):
         """Add a message to the activity log."""
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self.add_log_messages([message])
+    
+    def add_log_messages(self, messages: List[str]):
+        """Add several messages to the activity log in a single insert."""
+        # Follow new lines only if the user has not scrolled up to read older ones
+        at_bottom = self.log_text.yview()[1] >= 0.999
+        self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+        # Ring-buffer trim: memory and layout cost stay bounded on long runs
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count > self.max_log_lines:
+            self.log_text.delete('1.0', f'{line_count - self.max_log_lines}.0')
+        if at_bottom:
+            self.log_text.see(tk.END)
     
     def clear_logs(self):
         """Clear the activity log."""
-        self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state=tk.DISABLED)
+    
+    @staticmethod
+    def _block_log_edit(event):
+        """Key handler keeping the log read-only (copy/select shortcuts and navigation still work)."""
+        if event.state & 0x4 and event.keysym.lower() in ('c', 'a', 'insert'):
+            return None
+        if event.keysym in ('Up', 'Down', 'Left', 'Right', 'Prior', 'Next', 'Home', 'End'):
+            return None
+        return "break"
     
     def processing_finished(self):
         """Called when processing is finished."""
+        was_cancelled = self.cancelled
         self.processing = False
         self.paused = False
         self.cancelled = False
+        self._resume_event.set()
         
         self.start_button.config(state=tk.NORMAL)
         self.pause_button.config(state=tk.DISABLED, text="⏸️ Pause")
         self.cancel_button.config(state=tk.DISABLED)
         
-        if not self.cancelled:
+        if not was_cancelled:
             messagebox.showinfo("Terminé", "Le traitement est terminé !")
     
     def cleanup(self):
@@ -1104,22 +1432,21 @@ class RocksmithGuitarMuteGUI:
             if self.processing:
                 self.cancelled = True
                 self.logger.info("Cancelling ongoing processing...")
+            self._resume_event.set()  # Release a paused worker
+            self._confirm_event.set()  # Release a worker waiting for the overwrite answer
                 
-            # Wait for processing thread to finish (with timeout)
-            if self.processing_thread and self.processing_thread.is_alive():
-                self.logger.info("Waiting for processing thread to complete...")
-                self.processing_thread.join(timeout=5.0)
-                
-                if self.processing_thread.is_alive():
-                    self.logger.warning("Processing thread did not stop gracefully")
+            # Stop the worker thread (with timeout)
+            self.logger.info("Waiting for processing thread to complete...")
+            if not self._stop_worker(timeout=5.0):
+                self.logger.warning("Processing thread did not stop gracefully")
                 
-            # Clean up PyTorch/CUDA resources
+            # Clean up PyTorch/CUDA resources (only if torch was ever loaded;
+            # no synchronize: the process is exiting anyway)
             try:
-                import torch
-                if torch.cuda.is_available():
+                torch = sys.modules.get('torch')
+                if torch is not None and torch.cuda.is_available():
                     torch.cuda.empty_cache()
-                    torch.cuda.synchronize()
-                self.logger.info("PyTorch resources cleaned up")
+                    self.logger.info("PyTorch resources cleaned up")
             except Exception as e:
                 self.logger.debug(f"PyTorch cleanup error: {e}")
                 
@@ -1129,12 +1456,29 @@ class RocksmithGuitarMuteGUI:
                     thread.daemon = True
                     self.logger.debug(f"Set thread {thread.name} as daemon")
                     
-            # Clear the message queue
+            # Write pending debounced configuration changes (the app exits through
+            # os._exit, which skips atexit)
+            for module_name in ('gui.gui_config', 'gui_config'):
+                config_module = sys.modules.get(module_name)
+                if config_module is not None:
+                    try:
+                        config_module.GUIConfig.flush_all()
+                    except Exception as e:
+                        self.logger.debug(f"Error flushing configuration: {e}")
+            
+            # Clear the message queue first so the log listener is never left
+            # waiting for room while we join it
             try:
                 while not self.message_queue.empty():
                     self.message_queue.get_nowait()
             except:
                 pass
+            
+            # Stop relaying logs to the GUI
+            try:
+                self.stop_gui_logging()
+            except Exception as e:
+                self.logger.debug(f"Error stopping GUI logging: {e}")
                 
             self.logger.info("Cleanup completed successfully")
                         
@@ -1186,15 +1530,14 @@ class RocksmithGuitarMuteGUI:
                     
                 # Cancel processing gracefully
                 self.cancelled = True
+                self._resume_event.set()
+                self._confirm_event.set()
                 self.logger.info("User requested application shutdown during processing")
                 
                 # Wait a bit for cancellation to take effect
-                if self.processing_thread and self.processing_thread.is_alive():
-                    self.logger.info("Waiting for processing to stop...")
-                    self.processing_thread.join(timeout=3.0)
-                    
-                    if self.processing_thread.is_alive():
-                        self.logger.warning("Processing thread did not stop gracefully")
+                self.logger.info("Waiting for processing to stop...")
+                if not self._stop_worker(timeout=3.0):
+                    self.logger.warning("Processing thread did not stop gracefully")
             
             # Cleanup resources
             print("🔧 Nettoyage des ressources...")
@@ -1317,15 +1660,6 @@ def main():
             if thread != threading.current_thread() and thread.is_alive():
                 thread.daemon = True
         
-        # Force cleanup of PyTorch resources
-        try:
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-                torch.cuda.synchronize()
-        except:
-            pass
-        
         # Force garbage collection
         try:
             import gc
@@ -1343,4 +1677,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for worker processes in the frozen executable
+    multiprocessing.freeze_support()
     main()
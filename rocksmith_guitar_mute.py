@@ -29,6 +29,7 @@ if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
 
 import argparse
 import asyncio
+import functools
 import logging
 import multiprocessing
 import os
@@ -37,10 +38,22 @@ import shutil
 import subprocess
 import sys
 import tempfile
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+# Frozen builds ship the Demucs checkpoints in a "models" folder next to the
+# executable (models/hub/checkpoints); point torch.hub at it so they are read
+# in place instead of being downloaded again. An explicit TORCH_HOME wins.
+# Nuitka does not set sys.frozen but defines __compiled__; its onefile mode sets
+# sys.executable to the temporary unpack directory, so sys.argv[0] locates the exe.
+_nuitka_compiled = "__compiled__" in globals()
+if getattr(sys, 'frozen', False) or _nuitka_compiled:
+    _exe_path = sys.argv[0] if _nuitka_compiled else sys.executable
+    _bundled_models_dir = os.path.join(os.path.dirname(os.path.abspath(_exe_path)), 'models')
+    if os.path.isdir(_bundled_models_dir):
+        os.environ.setdefault('TORCH_HOME', _bundled_models_dir)
 
 import torch
 import torchaudio
@@ -67,35 +80,58 @@ def find_project_root() -> Path:
     return Path(__file__).parent.resolve()
 
 
+# Extra keyword arguments for every child process: no console window on Windows
+if sys.platform == "win32":
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # wShowWindow stays SW_HIDE
+    DEFAULT_POPEN_KWARGS = {
+        'creationflags': subprocess.CREATE_NO_WINDOW,
+        'startupinfo': _STARTUPINFO,
+    }
+else:
+    DEFAULT_POPEN_KWARGS = {}
+
+_subprocess_patched = False
+
+
 def patch_subprocess_for_silence():
-    """Patch subprocess module to ensure all calls are silent on Windows."""
-    if sys.platform == "win32":
-        import subprocess
+    """Patch subprocess module to ensure all calls are silent on Windows (once per process)."""
+    global _subprocess_patched
+    if sys.platform == "win32" and not _subprocess_patched:
+        _subprocess_patched = True
         original_run = subprocess.run
         original_popen = subprocess.Popen
         original_call = subprocess.call
         
+        def _apply_defaults(kwargs):
+            for key, value in DEFAULT_POPEN_KWARGS.items():
+                kwargs.setdefault(key, value)
+        
         def silent_run(*args, **kwargs):
-            if 'creationflags' not in kwargs:
-                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+            _apply_defaults(kwargs)
             if 'capture_output' not in kwargs and 'stdout' not in kwargs:
                 kwargs['capture_output'] = True
             return original_run(*args, **kwargs)
         
         def silent_popen(*args, **kwargs):
-            if 'creationflags' not in kwargs:
-                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+            _apply_defaults(kwargs)
             return original_popen(*args, **kwargs)
             
         def silent_call(*args, **kwargs):
-            if 'creationflags' not in kwargs:
-                kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
+            _apply_defaults(kwargs)
             return original_call(*args, **kwargs)
         
         subprocess.run = silent_run
         subprocess.Popen = silent_popen
         subprocess.call = silent_call
 
+
+@functools.lru_cache(maxsize=None)
+def _find_ffmpeg() -> Optional[str]:
+    """Return the ffmpeg executable on PATH, or None (looked up once per process)."""
+    return shutil.which("ffmpeg")
+
+
 # Demucs imports
 try:
     import demucs.separate
@@ -113,6 +149,21 @@ except ImportError:
     sys.exit(1)
 
 
+def resolve_device(device: str) -> str:
+    """Resolve "auto" to "cuda" or "cpu" without creating a processor."""
+    if device == "auto":
+        if torch.cuda.is_available():
+            return "cuda"
+        else:
+            return "cpu"
+    return device
+
+
+def pool_thread_count(workers: int) -> int:
+    """Torch intra-op threads per pool worker so that workers share the cores instead of oversubscribing them."""
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
 class RocksmithGuitarMute:
     """Main class for processing Rocksmith PSARC files to remove guitar tracks."""
     
@@ -139,12 +190,7 @@ class RocksmithGuitarMute:
     
     def _get_device(self, device: str) -> str:
         """Determine the best device to use for processing."""
-        if device == "auto":
-            if torch.cuda.is_available():
-                return "cuda"
-            else:
-                return "cpu"
-        return device
+        return resolve_device(device)
     
     def _load_audio_file(self, audio_path: Path) -> Tuple[torch.Tensor, int]:
         """
@@ -196,7 +242,7 @@ class RocksmithGuitarMute:
             capture_output=True,
             text=True,
             check=False,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            **DEFAULT_POPEN_KWARGS
         )
         
         if result.returncode != 0:
@@ -283,7 +329,7 @@ class RocksmithGuitarMute:
             [str(ww2ogg), str(wem_path), "-o", str(temp_ogg), "--pcb", str(packed_codebooks)], 
             check=True,
             capture_output=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            **DEFAULT_POPEN_KWARGS
         )
         
         # Try revorb for better compatibility
@@ -292,33 +338,51 @@ class RocksmithGuitarMute:
                 [str(revorb), str(temp_ogg)], 
                 check=True,
                 capture_output=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+                **DEFAULT_POPEN_KWARGS
             )
             self.logger.info("revorb processing completed successfully")
         except subprocess.CalledProcessError as e:
             self.logger.warning(f"revorb failed (code {e.returncode}), continuing with ww2ogg output")
         
-        # Convert OGG to WAV using soundfile (more robust for converted OGG files)
-        try:
-            audio_data, sr = sf.read(str(temp_ogg))
-            # Convert to tensor and ensure correct shape
-            if len(audio_data.shape) == 1:
-                audio_tensor = torch.from_numpy(audio_data).unsqueeze(0)  # Add channel dimension
-            else:
-                audio_tensor = torch.from_numpy(audio_data.T)  # Transpose for correct channel order
-            
-            torchaudio.save(str(output_path), audio_tensor, sr)
-            self.logger.info(f"Successfully converted WEM to WAV: {output_path.name}")
-        except Exception as e:
-            self.logger.error(f"Failed to load OGG with soundfile: {e}")
-            # Fallback: try with torchaudio
+        # Convert OGG to WAV: ffmpeg streams the decode without holding the whole
+        # waveform in Python; 32-bit float PCM matches what torchaudio.save wrote
+        converted = False
+        ffmpeg = _find_ffmpeg()
+        if ffmpeg is not None:
             try:
-                audio, sr = torchaudio.load(str(temp_ogg))
-                torchaudio.save(str(output_path), audio, sr)
-                self.logger.info(f"Successfully converted with torchaudio fallback: {output_path.name}")
-            except Exception as e2:
-                self.logger.error(f"Both soundfile and torchaudio failed: {e2}")
-                raise
+                subprocess.run(
+                    [ffmpeg, "-v", "error", "-threads", "1", "-i", str(temp_ogg), "-c:a", "pcm_f32le", "-f", "wav", str(output_path), "-y"],
+                    check=True,
+                    capture_output=True,
+                    **DEFAULT_POPEN_KWARGS
+                )
+                converted = True
+                self.logger.info(f"Successfully converted WEM to WAV with ffmpeg: {output_path.name}")
+            except (OSError, subprocess.CalledProcessError) as e:
+                self.logger.warning(f"ffmpeg conversion failed ({e}), falling back to soundfile")
+        
+        # Fallback: soundfile (more robust for converted OGG files), then torchaudio
+        if not converted:
+            try:
+                audio_data, sr = sf.read(str(temp_ogg))
+                # Convert to tensor and ensure correct shape
+                if len(audio_data.shape) == 1:
+                    audio_tensor = torch.from_numpy(audio_data).unsqueeze(0)  # Add channel dimension
+                else:
+                    audio_tensor = torch.from_numpy(audio_data.T)  # Transpose for correct channel order
+                
+                torchaudio.save(str(output_path), audio_tensor, sr)
+                self.logger.info(f"Successfully converted WEM to WAV: {output_path.name}")
+            except Exception as e:
+                self.logger.error(f"Failed to load OGG with soundfile: {e}")
+                # Fallback: try with torchaudio
+                try:
+                    audio, sr = torchaudio.load(str(temp_ogg))
+                    torchaudio.save(str(output_path), audio, sr)
+                    self.logger.info(f"Successfully converted with torchaudio fallback: {output_path.name}")
+                except Exception as e2:
+                    self.logger.error(f"Both soundfile and torchaudio failed: {e2}")
+                    raise
         
         # Clean up temporary OGG
         temp_ogg.unlink()
@@ -605,11 +669,16 @@ class RocksmithGuitarMute:
                 # Step 2: Find and process audio files
                 audio_files = self.find_audio_files(extract_dir)
                 
+                # Convert every WEM to WAV up front: the work happens in external
+                # ww2ogg/revorb/ffmpeg processes, so the conversions overlap
+                wem_files = [f for f in audio_files if f.suffix.lower() == '.wem']
+                if wem_files:
+                    with ThreadPoolExecutor(max_workers=min(len(wem_files), os.cpu_count() or 1)) as executor:
+                        list(executor.map(lambda wem: self.convert_wem_to_wav(wem, wem.with_suffix('.wav')), wem_files))
+                
                 for audio_file in audio_files:
                     if audio_file.suffix.lower() == '.wem':
-                        # Convert WEM to WAV for processing
                         wav_file = audio_file.with_suffix('.wav')
-                        self.convert_wem_to_wav(audio_file, wav_file)
                         
                         # Remove guitar track
                         processed_wav = wav_file.with_name(f"{wav_file.stem}_processed.wav")
@@ -671,7 +740,10 @@ class RocksmithGuitarMute:
                 self.logger.warning(f"Skipping non-PSARC file: {input_path}")
         
         elif input_path.is_dir():
-            psarc_files = list(input_path.glob("*.psarc"))
+            # Single directory pass; Path objects only for matching entries
+            with os.scandir(input_path) as entries:
+                psarc_files = [Path(entry.path) for entry in entries
+                               if entry.name.lower().endswith('.psarc') and entry.is_file()]
             self.logger.info(f"Found {len(psarc_files)} PSARC files in directory")
             
             if not psarc_files:
@@ -699,7 +771,9 @@ class RocksmithGuitarMute:
                 ]
                 
                 # Use ProcessPoolExecutor for CPU-bound tasks
-                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                with ProcessPoolExecutor(max_workers=max_workers, initializer=init_psarc_worker,
+                                         initargs=(self.demucs_model, self.device,
+                                                   pool_thread_count(max_workers))) as executor:
                     # Submit all tasks
                     future_to_file = {
                         executor.submit(process_single_psarc_worker, args): args[0] 
@@ -725,6 +799,33 @@ class RocksmithGuitarMute:
         return processed_files
 
 
+# Processors reused by every task run in the same worker process, keyed by (model, device)
+_worker_processors: Dict[Tuple[str, str], RocksmithGuitarMute] = {}
+
+
+def _get_worker_processor(demucs_model: str, device: str) -> RocksmithGuitarMute:
+    """Return this process's processor for (model, device), creating it on first use."""
+    key = (demucs_model, device)
+    processor = _worker_processors.get(key)
+    if processor is None:
+        processor = _worker_processors[key] = RocksmithGuitarMute(demucs_model=demucs_model, device=device)
+    return processor
+
+
+def init_psarc_worker(demucs_model: str, device: str, num_threads: Optional[int] = None) -> None:
+    """
+    ProcessPoolExecutor initializer: create the worker's processor once, up front.
+    
+    Args:
+        demucs_model: Demucs model to use for source separation
+        device: Device to use for processing
+        num_threads: Torch intra-op threads for this worker (None keeps torch's default)
+    """
+    if num_threads:
+        torch.set_num_threads(num_threads)
+    _get_worker_processor(demucs_model, device)
+
+
 def process_single_psarc_worker(args_tuple: Tuple[Path, Path, str, str, bool]) -> Optional[Path]:
     """
     Worker function for parallel processing of PSARC files.
@@ -738,8 +839,8 @@ def process_single_psarc_worker(args_tuple: Tuple[Path, Path, str, str, bool]) -
     psarc_path, output_dir, demucs_model, device, force = args_tuple
     
     try:
-        # Create a new processor instance for this worker
-        processor = RocksmithGuitarMute(demucs_model=demucs_model, device=device)
+        # Reuse this worker process's processor instance
+        processor = _get_worker_processor(demucs_model, device)
         return processor.process_psarc_file(psarc_path, output_dir, force=force)
     except Exception as e:
         logging.getLogger(__name__).error(f"Failed to process {psarc_path}: {e}")
@@ -804,6 +905,52 @@ def setup_logging(verbose: bool = False, log_file: str = None) -> None:
     _log_system_info(log_file)
 
 
+# Demucs models that already loaded in this process (failures are not cached)
+_available_demucs_models: Set[str] = set()
+
+
+def _check_demucs_model(model_name: str) -> Optional[str]:
+    """
+    Load a Demucs model to check it is available.
+    
+    Returns None if the model loads, otherwise the error message. Successful
+    loads are remembered so repeated diagnostics (one per GUI run) don't reload
+    the checkpoint; failures (e.g. a transient download error) are retried.
+    """
+    import contextlib
+    import demucs.pretrained
+    
+    if model_name in _available_demucs_models:
+        return None
+    
+    try:
+        # Capture output to prevent PyInstaller stdout/stderr issues
+        captured_output = io.StringIO()
+        captured_error = io.StringIO()
+        
+        with contextlib.redirect_stdout(captured_output), contextlib.redirect_stderr(captured_error):
+            demucs.pretrained.get_model(model_name)
+    except Exception as e:
+        return str(e)
+    _available_demucs_models.add(model_name)
+    return None
+
+
+def _log_demucs_models(logger: logging.Logger) -> None:
+    """Log whether the Demucs models used by the tool can be loaded."""
+    try:
+        logger.info("Checking Demucs models:")
+        models_to_check = ['htdemucs_6s', 'htdemucs', 'mdx_extra_q']
+        for model_name in models_to_check:
+            error = _check_demucs_model(model_name)
+            if error is None:
+                logger.info(f"  ✅ {model_name}: Available")
+            else:
+                logger.warning(f"  ⚠️  {model_name}: Not available - {error}")
+    except Exception as e:
+        logger.error(f"Error checking Demucs models: {e}")
+
+
 def _log_system_info(log_file: Path) -> None:
     """Log detailed system information for diagnostic purposes."""
     logger = logging.getLogger(__name__)
@@ -833,7 +980,7 @@ def _log_system_info(log_file: Path) -> None:
     
     # Environment variables
     logger.info("Environment variables:")
-    for key in ['PATH', 'PYTHONPATH', 'HOME', 'USERPROFILE', 'TEMP', 'TMP']:
+    for key in ['PATH', 'PYTHONPATH', 'HOME', 'USERPROFILE', 'TEMP', 'TMP', 'TORCH_HOME']:
         value = os.environ.get(key, 'Not set')
         logger.info(f"  {key}: {value}")
     
@@ -894,25 +1041,7 @@ def _log_system_info(log_file: Path) -> None:
         logger.error(f"Error getting PyTorch info: {e}")
     
     # Demucs models info
-    try:
-        import demucs.pretrained
-        import io
-        import contextlib
-        logger.info("Checking Demucs models:")
-        models_to_check = ['htdemucs_6s', 'htdemucs', 'mdx_extra_q']
-        for model_name in models_to_check:
-            try:
-                # Capture output to prevent PyInstaller stdout/stderr issues
-                captured_output = io.StringIO()
-                captured_error = io.StringIO()
-                
-                with contextlib.redirect_stdout(captured_output), contextlib.redirect_stderr(captured_error):
-                    model = demucs.pretrained.get_model(model_name)
-                logger.info(f"  ✅ {model_name}: Available")
-            except Exception as e:
-                logger.warning(f"  ⚠️  {model_name}: Not available - {e}")
-    except Exception as e:
-        logger.error(f"Error checking Demucs models: {e}")
+    _log_demucs_models(logger)
     
     # File system info
     logger.info("File system information:")
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests for the Windows build script helpers (build/build_windows.py)
+"""
+
+import fnmatch
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# Add build directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "build"))
+import build_windows
+
+
+def _make_tree(root: Path) -> None:
+    """Create a small tree with nested folders and read-only files."""
+    (root / "lib" / "sub").mkdir(parents=True)
+    (root / "a.txt").write_bytes(b"a" * 10)
+    (root / "lib" / "b.dll").write_bytes(b"b" * 100)
+    (root / "lib" / "sub" / "c.pyd").write_bytes(b"c" * 1000)
+    for path in (root / "a.txt", root / "lib" / "sub" / "c.pyd"):
+        os.chmod(path, stat.S_IREAD)
+
+
+def test_fast_rmtree_read_only():
+    """Test that _fast_rmtree removes a tree containing read-only files."""
+    print("🔍 Testing _fast_rmtree with read-only files...")
+
+    root = Path(tempfile.mkdtemp()) / "dist"
+    _make_tree(root)
+
+    assert build_windows._fast_rmtree(str(root)) == str(root)
+    assert not root.exists()
+
+    print("✅ Tree removed")
+    return True
+
+
+def test_remove_with_retry():
+    """Test that a PermissionError makes the file writable and is retried, then re-raised."""
+    print("🔍 Testing _remove_with_retry...")
+
+    path = Path(tempfile.mkdtemp()) / "locked.dll"
+    path.write_bytes(b"x")
+    os.chmod(path, stat.S_IREAD)
+
+    # Fails once (read-only file on Windows), succeeds after chmod
+    remove = mock.Mock(side_effect=[PermissionError, None])
+    with mock.patch.object(build_windows.time, "sleep"):
+        build_windows._remove_with_retry(remove, str(path))
+    assert remove.call_count == 2
+    assert os.stat(path).st_mode & stat.S_IWRITE
+
+    # Still locked after every attempt: the error reaches the caller
+    remove = mock.Mock(side_effect=PermissionError)
+    with mock.patch.object(build_windows.time, "sleep"):
+        try:
+            build_windows._remove_with_retry(remove, str(path), attempts=3)
+        except PermissionError:
+            pass
+        else:
+            raise AssertionError("PermissionError was swallowed")
+    assert remove.call_count == 3
+
+    print("✅ Retry works")
+    return True
+
+
+def test_remove_and_measure():
+    """Test that _remove_and_measure removes the tree and returns the freed size."""
+    print("🔍 Testing _remove_and_measure...")
+
+    root = Path(tempfile.mkdtemp()) / "docs"
+    _make_tree(root)
+    assert build_windows._remove_and_measure(str(root)) == 1110
+    assert not root.exists()
+
+    # A read-only file refused once (Windows) is made writable and removed
+    root = Path(tempfile.mkdtemp()) / "docs"
+    _make_tree(root)
+    real_unlink = os.unlink
+    refused = []
+
+    def unlink_once_refused(path):
+        if path.endswith("c.pyd") and not refused:
+            refused.append(path)
+            raise PermissionError(path)
+        real_unlink(path)
+
+    with mock.patch.object(build_windows.os, "unlink", side_effect=unlink_once_refused), \
+            mock.patch.object(build_windows.time, "sleep"):
+        assert build_windows._remove_and_measure(str(root)) == 1110
+    assert refused
+    assert not root.exists()
+
+    print("✅ Tree removed and measured")
+    return True
+
+
+# Patterns of the original per-glob cleanup in optimize_distribution
+DIST_PATTERNS = ['*.pyc', '__pycache__', 'test*', 'tests', 'examples', 'docs',
+                 '*.md', 'LICENSE*', 'CHANGELOG*', 'README*']
+
+DIST_FILES = [
+    'RockSmithGuitarMute.exe', 'README.txt', 'a.pyc', 'A.PYC', 'a.pyc.bak',
+    'testing.py', 'contest.py', 'docs.txt', 'notes.md', 'notes.mdx', 'LICENSE.txt',
+    'CHANGELOG', 'README.md', '__pycache__/x.pyc', 'tests/data.bin',
+    'lib/x.dll', 'lib/README.txt', 'lib/LICENSE', 'lib/examples/demo.py',
+    'torch/docs/index.html', 'torch/test/unit.py', 'torch/testing.dll', 'torch/libtest.so',
+]
+
+
+def test_optimize_distribution_patterns():
+    """Test that the fused regex removes exactly what the original globs matched."""
+    print("🔍 Testing optimize_distribution patterns...")
+
+    work_dir = Path(tempfile.mkdtemp())
+    dist_dir = work_dir / "dist" / "RockSmithGuitarMute"
+    for name in DIST_FILES:
+        path = dist_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x")
+
+    def removed_by_globs(relative: str) -> bool:
+        parts = relative.split('/')
+        matched = [any(fnmatch.fnmatch(part, p) for p in DIST_PATTERNS) for part in parts]
+        # Our README.txt is kept, unless one of its folders is removed
+        if parts[-1] == 'README.txt':
+            return any(matched[:-1])
+        return any(matched)
+
+    expected = sorted(name for name in DIST_FILES if not removed_by_globs(name))
+
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        build_windows.optimize_distribution()
+    finally:
+        os.chdir(cwd)
+
+    remaining = sorted(path.relative_to(dist_dir).as_posix()
+                       for path in dist_dir.rglob('*') if path.is_file())
+    assert remaining == expected, f"{remaining} != {expected}"
+    assert not (dist_dir / "__pycache__").exists()
+    assert not (dist_dir / "torch" / "docs").exists()
+
+    print("✅ Same files removed as the original globs")
+    return True
+
+
+def main():
+    """Main test function."""
+    print("🧪 RockSmith Guitar Mute Build Tests")
+    print("=" * 60)
+
+    tests = [
+        ("Fast rmtree", test_fast_rmtree_read_only),
+        ("Remove with retry", test_remove_with_retry),
+        ("Remove and measure", test_remove_and_measure),
+        ("Distribution patterns", test_optimize_distribution_patterns),
+    ]
+
+    results = []
+
+    for test_name, test_func in tests:
+        print(f"\n📋 {test_name}:")
+        try:
+            result = test_func()
+            results.append((test_name, result))
+        except Exception as e:
+            print(f"❌ Unexpected error: {e!r}")
+            results.append((test_name, False))
+
+    passed = sum(1 for _, result in results if result)
+    print(f"\n🎯 Result: {passed}/{len(results)} tests passed")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -3,9 +3,14 @@
 Test script for RockSmith Guitar Mute GUI
 """
 
+import queue
 import sys
+import tempfile
+import threading
+import time
 import tkinter as tk
 from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -108,6 +113,155 @@ def test_config():
         print(f"❌ Configuration error: {e}")
         return False
 
+def _isolated_config(save_delay=0.2):
+    """Create a GUIConfig whose file lives in a temporary home directory."""
+    from gui.gui_config import GUIConfig
+    
+    home = Path(tempfile.mkdtemp())
+    with mock.patch.object(Path, "home", return_value=home):
+        config = GUIConfig()
+    config.SAVE_DELAY = save_delay
+    return config
+
+def test_config_debounce_and_flush():
+    """Test that changes are saved once after the delay, or immediately on flush."""
+    print("🔍 Testing configuration debounce and flush...")
+    
+    from gui.gui_config import GUIConfig
+    
+    # Debounced: nothing written before the delay, one write after it
+    config = _isolated_config(save_delay=0.2)
+    config.set("device", "cpu")
+    config.set("workers", 2)
+    assert not config.config_file.exists(), "config written before SAVE_DELAY"
+    time.sleep(0.5)
+    assert config.config_file.exists(), "config not written after SAVE_DELAY"
+    
+    # Explicit flush (the close path) writes pending changes without waiting
+    config = _isolated_config(save_delay=60)
+    config.set("device", "cuda")
+    GUIConfig.flush_all()
+    assert config.config_file.exists(), "flush_all did not write pending changes"
+    
+    with mock.patch.object(Path, "home", return_value=config.config_file.parent.parent):
+        reloaded = GUIConfig()
+    assert reloaded.get("device") == "cuda"
+    
+    # Nothing pending: flush does not rewrite the file
+    config.config_file.unlink()
+    config.flush()
+    assert not config.config_file.exists(), "flush wrote a clean configuration"
+    
+    print("✅ Debounce and flush work")
+    return True
+
+def test_config_recent_paths():
+    """Test recent paths: most recent first, no duplicates, bounded length."""
+    print("🔍 Testing recent paths...")
+    
+    config = _isolated_config(save_delay=60)
+    for i in range(config.MAX_RECENT + 3):
+        config.add_recent_input(f"/songs/{i}")
+    
+    recent = config.get_recent_inputs()
+    assert len(recent) == config.MAX_RECENT
+    assert recent[0] == f"/songs/{config.MAX_RECENT + 2}"
+    assert "/songs/0" not in recent
+    
+    # Re-adding an existing path moves it to the front without duplicating it
+    config.add_recent_input("/songs/5")
+    recent = config.get_recent_inputs()
+    assert recent[0] == "/songs/5"
+    assert recent.count("/songs/5") == 1
+    assert len(recent) == config.MAX_RECENT
+    
+    # The order survives a save/reload round trip
+    config.flush()
+    with mock.patch.object(Path, "home", return_value=config.config_file.parent.parent):
+        from gui.gui_config import GUIConfig
+        reloaded = GUIConfig()
+    assert reloaded.get_recent_inputs() == recent
+    
+    # Still bounded after reload
+    reloaded.add_recent_input("/songs/new")
+    assert len(reloaded.get_recent_inputs()) == config.MAX_RECENT
+    
+    print("✅ Recent paths work")
+    return True
+
+def _bare_gui():
+    """Create a GUI object with only the worker/Tk handshake state (no window)."""
+    from gui.gui_main import RocksmithGuitarMuteGUI
+    
+    app = object.__new__(RocksmithGuitarMuteGUI)
+    app.message_queue = queue.Queue()
+    app._confirm_event = threading.Event()
+    app._confirm_result = False
+    app.cancelled = False
+    app.shutdown_requested = False
+    return app
+
+def test_list_input_files():
+    """Test the input listing done on the worker thread."""
+    print("🔍 Testing input file listing...")
+    
+    app = _bare_gui()
+    folder = Path(tempfile.mkdtemp())
+    for name in ("a.psarc", "B.PSARC", "notes.txt"):
+        (folder / name).write_bytes(b"x")
+    (folder / "sub.psarc").mkdir()
+    
+    files = app._list_input_files(folder)
+    assert sorted(f.name for f in files) == ["B.PSARC", "a.psarc"]
+    assert app._list_input_files(folder / "a.psarc") == [folder / "a.psarc"]
+    assert app._list_input_files(folder / "notes.txt") == []
+    assert app.message_queue.empty()
+    
+    # A missing input posts an error for the Tk thread instead of raising
+    assert app._list_input_files(folder / "missing") is None
+    kind, _ = app.message_queue.get_nowait()
+    assert kind == 'error'
+    
+    print("✅ Input listing works")
+    return True
+
+def test_overwrite_handshake():
+    """Test the overwrite confirmation between the worker and the Tk thread."""
+    print("🔍 Testing overwrite confirmation handshake...")
+    
+    from gui import gui_main
+    
+    def run_worker(app, count):
+        result = {}
+        worker = threading.Thread(target=lambda: result.update(answer=app._confirm_overwrite(count)))
+        worker.start()
+        # The worker posts the request and blocks until the Tk thread answers
+        assert app.message_queue.get(timeout=2) == ('confirm_overwrite', count)
+        assert worker.is_alive()
+        return worker, result
+    
+    for answer in (True, False):
+        app = _bare_gui()
+        worker, result = run_worker(app, 3)
+        with mock.patch.object(gui_main.messagebox, "askyesno", return_value=answer) as ask:
+            app._ask_overwrite(3)
+        assert "3 file(s)" in ask.call_args[0][1]
+        worker.join(timeout=2)
+        assert not worker.is_alive()
+        assert result["answer"] is answer
+    
+    # Closing the window releases the worker with a refusal, even after a "yes"
+    app = _bare_gui()
+    worker, result = run_worker(app, 1)
+    app._confirm_result = True
+    app.cancelled = True
+    app._confirm_event.set()
+    worker.join(timeout=2)
+    assert result["answer"] is False
+    
+    print("✅ Overwrite handshake works")
+    return True
+
 def main():
     """Main test function."""
     print("🧪 RockSmith Guitar Mute GUI Tests")
@@ -118,6 +272,10 @@ def main():
         ("Dependencies", test_dependencies),
         ("GUI Import", test_gui_import),
         ("Configuration", test_config),
+        ("Configuration debounce/flush", test_config_debounce_and_flush),
+        ("Recent paths", test_config_recent_paths),
+        ("Input listing", test_list_input_files),
+        ("Overwrite handshake", test_overwrite_handshake),
         ("GUI Creation", test_gui_creation),
     ]
     